@@ -18,13 +18,13 @@ sonar_reference_point = {'.all': ['tx_x', 'tx_y', 'tx_z'],
 
 
 def _check_multibeam_file(multibeam_file: str):
-    fileext = os.path.splitext(multibeam_file)[1]
+    fileext = os.path.splitext(multibeam_file)[1].lower()
     if fileext not in kluster_variables.supported_multibeam:
         raise NotImplementedError('fqpr_drivers: File ({}) is not a Kluster supported multibeam file ({})'.format(multibeam_file, kluster_variables.supported_multibeam))
 
 
 def _check_sbet_file(sbet_file: str):
-    fileext = os.path.splitext(sbet_file)[1]
+    fileext = os.path.splitext(sbet_file)[1].lower()
     if fileext not in kluster_variables.supported_ppnav:
         raise NotImplementedError('fqpr_drivers: File ({}) is not a Kluster supported post processed navigation (SBET) file ({})'.format(sbet_file, kluster_variables.supported_ppnav))
 
@@ -38,13 +38,13 @@ def _check_pos_file(pos_file: str):
 
 
 def _check_export_log_file(log_file: str):
-    fileext = os.path.splitext(log_file)[1]
+    fileext = os.path.splitext(log_file)[1].lower()
     if fileext not in kluster_variables.supported_ppnav_log:
         raise NotImplementedError('fqpr_drivers: File ({}) is not a Kluster supported export log file ({})'.format(log_file, kluster_variables.supported_ppnav_log))
 
 
 def _check_svp_file(svp_file: str):
-    fileext = os.path.splitext(svp_file)[1]
+    fileext = os.path.splitext(svp_file)[1].lower()
     if fileext not in kluster_variables.supported_sv:
         raise NotImplementedError('fqpr_drivers: File ({}) is not a Kluster supported sound velocity file ({})'.format(svp_file, kluster_variables.supported_sv))
 
@@ -77,7 +77,7 @@ def fast_read_multibeam_metadata(multibeam_file: str, gather_times: bool = True,
     """
 
     _check_multibeam_file(multibeam_file)
-    fileext = os.path.splitext(multibeam_file)[1]
+    fileext = os.path.splitext(multibeam_file)[1].lower()
     if fileext == '.all':
         mtype = 'kongsberg_all'
         aread = par3.AllRead(multibeam_file)
@@ -132,7 +132,7 @@ def return_xyz_from_multibeam(multibeam_file: str):
     """
 
     _check_multibeam_file(multibeam_file)
-    mbes_extension = os.path.splitext(multibeam_file)[1]
+    mbes_extension = os.path.splitext(multibeam_file)[1].lower()
     if mbes_extension == '.all':
         print('Reading from xyz88/.all file with par Allread...')
         x, y, z, times, counters = _xyz_from_allfile(multibeam_file)
@@ -168,7 +168,7 @@ def sequential_read_multibeam(multibeam_file: str, start_pointer: int = 0, end_p
     """
 
     _check_multibeam_file(multibeam_file)
-    multibeam_extension = os.path.splitext(multibeam_file)[1]
+    multibeam_extension = os.path.splitext(multibeam_file)[1].lower()
     if multibeam_extension == '.all':
         ar = par3.AllRead(multibeam_file, start_ptr=start_pointer, end_ptr=end_pointer)
         recs = ar.sequential_read_records(first_installation_rec=first_installation_rec)
@@ -1,16 +1,25 @@
 import os
+import stat as stat_module
+import bisect
 from datetime import datetime, timezone
 import numpy as np
 import logging
 from difflib import get_close_matches
+try:  # prefer the C-backed scorer when available, difflib's pure python matcher is the fallback
+    from rapidfuzz import fuzz as rapidfuzz_fuzz, process as rapidfuzz_process
+except ImportError:
+    rapidfuzz_process = None
+from functools import lru_cache
 from types import FunctionType
 from typing import Union
 from copy import deepcopy
-from collections import OrderedDict
+from collections import Counter, OrderedDict, defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor
+from threading import Lock, Timer
 from dask.distributed import Client
 
-from HSTB.kluster.fqpr_drivers import fast_read_multibeam_metadata, fast_read_sbet_metadata, fast_read_errorfile_metadata, \
-    read_pospac_export_log, is_sbet, is_smrmsg, read_soundvelocity_file
+# NOTE: HSTB.kluster.fqpr_drivers (which imports all of the HSTB.drivers file readers) is deliberately imported
+#   inside the functions that need it, so that importing this module does not pay the full driver import cost
 from HSTB.kluster import monitor, fqpr_actions
 from HSTB.kluster.fqpr_project import FqprProject
 from HSTB.kluster.fqpr_helpers import build_crs
@@ -23,7 +32,66 @@ supported_mbes = kluster_variables.supported_multibeam
 supported_sbet = kluster_variables.supported_ppnav  # people keep mixing up these extensions, so just check for the nav/smrmsg in both
 supported_export_log = kluster_variables.supported_ppnav_log
 supported_svp = kluster_variables.supported_sv
-all_extensions = list(np.concatenate([supported_mbes, supported_sbet, supported_export_log, supported_svp]))
+all_extensions = frozenset(supported_mbes + supported_sbet + supported_export_log + supported_svp)
+
+# frozenset copies of the supported extension lists, membership tests in the add_file hot path are O(1) this way
+_mbes_extensions = frozenset(supported_mbes)
+_sbet_extensions = frozenset(supported_sbet)
+_export_log_extensions = frozenset(supported_export_log)
+_svp_extensions = frozenset(supported_svp)
+
+# data type -> which category of file matches need to be rerun when a file of that type is added/removed
+_rerun_category = {'multibeam': 'mbes', 'svp': 'svp', 'navigation': 'nav', 'naverror': 'nav', 'navlog': 'nav'}
+
+# bound once so the gather hot paths skip the module attribute lookup on every timestamp conversion
+_utc = timezone.utc
+_ts2dt = datetime.fromtimestamp
+
+# os.path.normpath is a pure python routine that shows up in profiles when files are added/removed in bulk, and
+#   the same paths come through repeatedly (monitor churn, group recomputes, project close).  Memoize it.
+_normpath = lru_cache(maxsize=16384)(os.path.normpath)
+
+# tool tip messages for the nav matchers, built once here instead of being concatenated per matched file
+_navlog_matched_reason = ('Navigation export log file (POSPac export log)\n\n'
+                          'Match with {}\nMatches are made using:\n\n'
+                          '- matching characters between the error file path and the navigation file path\n'
+                          '- file system location, nav files that are in the same directory as this error file are preferred\n'
+                          '- the start and end time of the nav file, will prefer the closest error file in time\n')
+_navlog_unmatched_reason = ('Navigation export log file (POSPac export log)\n\n'
+                            'No matching navigation file for this log file.\nMatches are made using:\n\n'
+                            '- matching characters between the log file path and the navigation file path\n'
+                            '- file system location, nav files that are in the same directory as this log file are preferred\n'
+                            '- the export name in the log file, will prefer that file name for the matching navigation file\n')
+_naverror_matched_reason = ('Navigation error file (POSPac smrmsg file)\n\n'
+                            'Match with {}\nMatches are made using:\n\n'
+                            '- matching characters between the error file path and the navigation file path\n'
+                            '- file system location, nav files that are in the same directory as this error file are preferred\n'
+                            '- the start and end time of the nav file, will prefer the closest error file in time\n')
+_naverror_unmatched_reason = ('Navigation error file (POSPac smrmsg file)\n\n'
+                              'No matching navigation file for this error file.\nMatches are made using:\n\n'
+                              '- matching characters between the error file path and the navigation file path\n'
+                              '- file system location, nav files that are in the same directory as this error file are preferred\n'
+                              '- the start and end time of the nav file, will prefer the closest error file in time\n')
+
+
+def _snapshot_groups(groups: dict):
+    """
+    Shallow structural copy of a groups dict ({destination: [files...]} or {file: match}).  The buffered copies in
+    FqprIntel only exist for the equality compare in update_matches, so copying the container one level deep is
+    enough and avoids deepcopy walking every string.
+
+    Parameters
+    ----------
+    groups
+        dict of destination -> list of files, or a flat str -> str lookup
+
+    Returns
+    -------
+    dict
+        one level deep copy of groups
+    """
+
+    return {ky: list(val) if isinstance(val, list) else val for ky, val in groups.items()}
 
 
 class LoggerClass:
@@ -36,7 +104,7 @@ class LoggerClass:
         self.silent = silent
         self.logger = logger
 
-    def print_msg(self, msg: str, loglvl: int = logging.INFO):
+    def print_msg(self, msg: str, loglvl: int = logging.INFO, *args):
         """
         Either print to console, print using logger, or do not print at all, if self.silent = True
 
@@ -46,15 +114,20 @@ class LoggerClass:
             message contents as string
         loglvl
             one of the logging enum values, logging.info or logging.warning as example
+        args
+            optional logging-style ('%s' placeholder) format arguments, only formatted if the message is actually
+            emitted, so hot paths can skip building strings that a silent/filtered logger would discard
         """
 
         if self.logger is not None:
             if not isinstance(loglvl, int):
                 raise ValueError('Log level must be an int (see logging enum), found {}'.format(loglvl))
-            self.logger.log(loglvl, msg)
+            self.logger.log(loglvl, msg, *args)
         elif self.silent:
             pass
         else:
+            if args:
+                msg = msg % args
             print(msg)
 
 
@@ -75,6 +148,10 @@ class FqprIntel(LoggerClass):
     If the incoming file is an SVP, run svcorrect on the cast on the nearest in time data that would apply.
     """
 
+    # optional max size in kB for added multibeam files, files larger than this are skipped with a warning rather
+    #   than letting one huge file block the monitor event handling
+    max_mbes_size_kb = None
+
     def __init__(self, project=None, parent=None, **kwargs):
         super().__init__(**kwargs)
         self.project = project
@@ -89,9 +166,24 @@ class FqprIntel(LoggerClass):
         self.naverror_intel = NavErrorModule(silent=self.silent, logger=self.logger)
         self.navlog_intel = NavExportLogModule(silent=self.silent, logger=self.logger)
         self.svp_intel = SvpModule(silent=self.silent, logger=self.logger)
+        self._intel_modules = (self.multibeam_intel, self.nav_intel, self.naverror_intel, self.navlog_intel,
+                               self.svp_intel)
 
         self.unique_id = 0
         self.monitors = {}
+        self._deferred_match_categories = set()  # rerun categories accumulated while defer_matches is in effect
+        self._last_unmatched = None  # last unmatched-file dict pushed to the action container, see _build_unmatched_list
+        self._path_to_intel = {}  # normalized filepath -> (intel module, data type) for added files, see remove_file
+
+        # monitor events are buffered here and coalesced (repeat events collapsed, created+deleted pairs cancelled)
+        #   before dispatching to add_file/remove_file, see _flush_monitor_events
+        self._event_queue = deque()
+        self._event_lock = Lock()
+        self._event_flush_timer = None
+        self.monitor_event_buffer_time = 0.25  # seconds we buffer monitor events before flushing them
+        # pool for running the i/o bound gather functions when a monitor flush has several new files
+        self._gather_pool = ThreadPoolExecutor(max_workers=min(8, os.cpu_count() or 1),
+                                               thread_name_prefix='intel_gather')
 
         self.action_container = fqpr_actions.FqprActionContainer(self)
         self._buffered_multibeam_line_groups = {}
@@ -123,7 +215,9 @@ class FqprIntel(LoggerClass):
 
     def _handle_monitor_event(self, filepath, file_event):
         """
-        Direct the events from the directory monitoring object to either adding a new file or removing an existing file
+        Direct the events from the directory monitoring object to either adding a new file or removing an existing file.
+        Events are buffered for a short window (see monitor_event_buffer_time) so that big directory drops are handled
+        in one coalesced batch instead of one dispatch per filesystem event.
 
         Parameters
         ----------
@@ -132,10 +226,48 @@ class FqprIntel(LoggerClass):
         file_event
             one of 'created', 'deleted'
         """
-        if file_event == 'created':
-            self.add_file(filepath)
-        else:
-            self.remove_file(filepath)
+        with self._event_lock:
+            self._event_queue.append((filepath, file_event))
+            if self._event_flush_timer is None:
+                self._event_flush_timer = Timer(self.monitor_event_buffer_time, self._flush_monitor_events)
+                self._event_flush_timer.daemon = True
+                self._event_flush_timer.start()
+
+    def _flush_monitor_events(self):
+        """
+        Drain the buffered monitor events and dispatch them to add_file/remove_file.  Repeat events for the same file
+        collapse to one, and a created event followed by a deleted event for the same file cancels out entirely, so a
+        file that appears and disappears within the buffer window never costs us a gather/stat.
+        """
+        with self._event_lock:
+            self._event_flush_timer = None
+            events = list(self._event_queue)
+            self._event_queue.clear()
+        coalesced = {}  # (filepath, file_event) keys, preserves first-seen order and drops repeats
+        for filepath, file_event in events:
+            if file_event == 'deleted' and (filepath, 'created') in coalesced:
+                del coalesced[(filepath, 'created')]  # created and deleted within the same window, events cancel
+                continue
+            coalesced[(filepath, file_event)] = None
+        created = [filepath for filepath, file_event in coalesced if file_event == 'created']
+        futures = {}
+        if len(created) > 1:  # several new files at once, overlap the i/o bound gathers across the pool
+            futures = {filepath: self._gather_pool.submit(self._gather_file_info, _normpath(filepath))
+                       for filepath in created}
+        for filepath, file_event in coalesced:
+            try:
+                if file_event == 'created':
+                    if filepath in futures:
+                        gathered_data, intel_module, data_type, rerun_category = futures[filepath].result()
+                        self._register_file_info(_normpath(filepath), gathered_data, intel_module, data_type,
+                                                 rerun_category, defer_matches=True)
+                    else:
+                        self.add_file(filepath, defer_matches=True)
+                else:
+                    self.remove_file(filepath, defer_matches=True)
+            except Exception as e:
+                self.print_msg('Unable to load from file {}: {}'.format(filepath, e), logging.ERROR)
+        self.run_deferred_matches()
 
     def set_settings(self, settings: dict):
         """
@@ -208,7 +340,8 @@ class FqprIntel(LoggerClass):
 
     def return_intel_modules(self):
         """
-        Return a list of all intel modules
+        Return a list of all intel modules.  The modules are held in a tuple built once at init, this just copies it
+        into a new list for the caller.
 
         Returns
         -------
@@ -216,12 +349,7 @@ class FqprIntel(LoggerClass):
             list of all intel modules
         """
 
-        intel_modules = []
-        for attr in vars(self):
-            potential_module = self.__getattribute__(attr)
-            if isinstance(potential_module, IntelModule):
-                intel_modules.append(potential_module)
-        return intel_modules
+        return list(self._intel_modules)
 
     def start_folder_monitor(self, folderpath, is_recursive=True):
         """
@@ -236,7 +364,7 @@ class FqprIntel(LoggerClass):
             if True, search subdirectories as well
         """
 
-        folderpath = os.path.normpath(folderpath)
+        folderpath = _normpath(folderpath)
         if os.path.isdir(folderpath):
             self.stop_folder_monitor(folderpath)
             # you have to recreate the DirectoryMonitor object, there is no restart
@@ -257,7 +385,7 @@ class FqprIntel(LoggerClass):
             absolute folder path to the directory we want to monitor
         """
 
-        folderpath = os.path.normpath(folderpath)
+        folderpath = _normpath(folderpath)
         if folderpath in self.monitors:
             self.monitors[folderpath].stop()
             self.monitors.pop(folderpath)
@@ -279,7 +407,7 @@ class FqprIntel(LoggerClass):
 
         Returns
         -------
-        OrderedDict
+        dict
             dictionary object with all metadata related to the provided file
         str
             returns the data type here if the file was successfully added
@@ -287,18 +415,73 @@ class FqprIntel(LoggerClass):
             return a separate bool value to trigger the rerun_xxx_matches
         """
 
-        if data:
-            data['unique_id'] = self.unique_id
-            self.unique_id += 1
-            added = intel.add_dict(data)
-            if added:
-                return data, data_type, True
-            else:
-                return data, '', False
-        else:
+        if not data:
             return data, '', False
+        uid = self.unique_id
+        data['unique_id'] = uid
+        self.unique_id = uid + 1
+        if intel.add_dict(data):
+            self._path_to_intel[_normpath(data['file_path'])] = (intel, data_type)
+            return data, data_type, True
+        return data, '', False
 
-    def add_file(self, infile: str, silent: bool = True):
+    def _gather_file_info(self, infile: str, silent: bool = True):
+        """
+        The I/O bound portion of add_file.  Reads the file level metadata without touching any of the intel module
+        state, so it is safe to run in a worker thread (see _flush_monitor_events).
+
+        Parameters
+        ----------
+        infile
+            full normalized file path to the new file
+        silent
+            if silent, will not print message on failing to gather
+
+        Returns
+        -------
+        dict
+            attributes associated with one of the gather_xxxx functions, None if the file is excluded/unsupported
+        IntelModule
+            the intel module the gathered data belongs to, None if the file is excluded/unsupported
+        str
+            data type of the file as a string (ex: 'multibeam')
+        str
+            rerun match category, one of 'mbes', 'nav', 'svp' or an empty string
+        """
+
+        fileext = os.path.splitext(infile)[1].lower()  # users routinely ship .ALL/.KMALL files, treat those the same
+        filename = os.path.basename(infile)
+        dispatch = _ext_dispatch.get(fileext)
+        if filename in excluded_files:
+            if not silent:
+                self.print_msg('File is listed as an exluded file: {}'.format(infile), logging.ERROR)
+        elif dispatch is not None:
+            gather_function, intel_attribute, data_type, rerun_category = dispatch
+            if gather_function is None:  # sbet and smrmsg share extensions, disambiguate by file content
+                try:
+                    mtime_ns = os.stat(infile).st_mtime_ns
+                except FileNotFoundError:
+                    mtime_ns = None
+                classification = _classify_nav_file(infile, mtime_ns)
+                if classification == 'sbet':
+                    return _cached_gather(gather_navfile_info, infile), self.nav_intel, 'navigation', 'nav'
+                elif classification == 'smrmsg':
+                    return _cached_gather(gather_naverrorfile_info, infile), self.naverror_intel, 'naverror', 'nav'
+                return None, None, '', ''
+            if data_type == 'multibeam' and self.max_mbes_size_kb is not None:
+                # check the cheap stat based size before the expensive multibeam metadata read
+                basic = gather_basic_file_info(infile)
+                if basic['file_size_kb'] > self.max_mbes_size_kb:
+                    self.print_msg('Skipping {}: file size of {}kb exceeds the maximum allowed size of {}kb'.format(
+                        infile, basic['file_size_kb'], self.max_mbes_size_kb), logging.WARNING)
+                    return None, None, '', ''
+            return _cached_gather(gather_function, infile), getattr(self, intel_attribute), data_type, rerun_category
+        else:
+            if not silent:
+                self.print_msg('File is not of a supported type: {}'.format(infile), logging.ERROR)
+        return None, None, '', ''
+
+    def add_file(self, infile: str, silent: bool = True, defer_matches: bool = False):
         """
         Starting point for FqprIntel, adding a file to the class which then adds it to one of the intel objects.
 
@@ -311,20 +494,60 @@ class FqprIntel(LoggerClass):
             full file path to the new file
         silent
             if silent, will not print messag on failing to add
+        defer_matches
+            if True, accumulate the match rerun for this file instead of running it now, see run_deferred_matches
 
         Returns
         -------
         str
             the updated_type that matches this file
-        OrderedDict
+        dict
+            attributes associated with one of the gather_xxxx functions
+        bool
+            True if a new project was created or loaded
+        """
+
+        if os.path.splitext(infile)[1].lower() not in all_extensions:
+            # foreign file in a watched directory, bail before paying for normpath/gather/project setup
+            if not silent:
+                self.print_msg('File is not of a supported type: {}'.format(infile), logging.ERROR)
+            return '', None, False
+        infile = _normpath(infile)
+        gathered_data, intel_module, data_type, rerun_category = self._gather_file_info(infile, silent=silent)
+        return self._register_file_info(infile, gathered_data, intel_module, data_type, rerun_category,
+                                        defer_matches=defer_matches)
+
+    def _register_file_info(self, infile: str, gathered_data, intel_module, data_type: str, rerun_category: str,
+                            defer_matches: bool = False):
+        """
+        The state mutating portion of add_file, runs in the main thread.  Adds the gathered data to the matching intel
+        module, sets up the project if this is the first added file, and reruns the file matches.
+
+        Parameters
+        ----------
+        infile
+            full normalized file path to the new file
+        gathered_data
+            attributes associated with one of the gather_xxxx functions, None if the file is excluded/unsupported
+        intel_module
+            the intel module the gathered data belongs to, None if the file is excluded/unsupported
+        data_type
+            data type of the file as a string (ex: 'multibeam')
+        rerun_category
+            rerun match category, one of 'mbes', 'nav', 'svp' or an empty string
+        defer_matches
+            if True, accumulate the match rerun for this file instead of running it now, see run_deferred_matches
+
+        Returns
+        -------
+        str
+            the updated_type that matches this file
+        dict
             attributes associated with one of the gather_xxxx functions
         bool
             True if a new project was created or loaded
         """
 
-        infile = os.path.normpath(infile)
-        fileext = os.path.splitext(infile)[1]
-        filename = os.path.split(infile)[1]
         updated_type = ''
         new_data = None
         new_project = False
@@ -333,23 +556,14 @@ class FqprIntel(LoggerClass):
         rerun_nav_file_match = False
         rerun_svp_file_match = False
 
-        if filename in excluded_files:
-            if not silent:
-                self.print_msg('File is listed as an exluded file: {}'.format(infile), logging.ERROR)
-        elif fileext in supported_mbes:
-            new_data, updated_type, rerun_mbes_file_match = self._add_to_intel(gather_multibeam_info(infile), self.multibeam_intel, 'multibeam')
-        elif fileext in supported_svp:
-            new_data, updated_type, rerun_svp_file_match = self._add_to_intel(gather_svp_info(infile), self.svp_intel, 'svp')
-        elif fileext in supported_sbet:  # sbet and smrmsg have the same file extension sometimes ('.out') depending on what the user has done
-            if is_sbet(infile):
-                new_data, updated_type, rerun_nav_file_match = self._add_to_intel(gather_navfile_info(infile), self.nav_intel, 'navigation')
-            elif is_smrmsg(infile):
-                new_data, updated_type, rerun_nav_file_match = self._add_to_intel(gather_naverrorfile_info(infile), self.naverror_intel, 'naverror')
-        elif fileext in supported_export_log:
-            new_data, updated_type, rerun_nav_file_match = self._add_to_intel(gather_exportlogfile_info(infile), self.navlog_intel, 'navlog')
-        else:
-            if not silent:
-                self.print_msg('File is not of a supported type: {}'.format(infile), logging.ERROR)
+        if intel_module is not None:
+            new_data, updated_type, rerun_match = self._add_to_intel(gathered_data, intel_module, data_type)
+            if rerun_category == 'mbes':
+                rerun_mbes_file_match = rerun_match
+            elif rerun_category == 'svp':
+                rerun_svp_file_match = rerun_match
+            else:
+                rerun_nav_file_match = rerun_match
 
         # added files so lets load the existing project or setup a new one if there is no existing project
         if new_data:
@@ -364,21 +578,100 @@ class FqprIntel(LoggerClass):
                     new_project = True
 
         # added files, so lets rebuild the matches for the appropriate category
-        if rerun_mbes_file_match:
-            self.match_multibeam_files_to_project()
-        elif rerun_nav_file_match:
-            self.match_navigation_files()
-            self.match_navigation_files_to_project()
-        elif rerun_svp_file_match:
-            self.match_svp_files_to_project()
-
-        # adding any new files should trigger rebuilding the action tab
-        if updated_type:
-            self.update_matches()
+        if defer_matches:
+            self._defer_match_rerun(updated_type, rerun_mbes_file_match, rerun_nav_file_match, rerun_svp_file_match)
+        else:
+            if rerun_mbes_file_match:
+                self.match_multibeam_files_to_project()
+            elif rerun_nav_file_match:
+                self.match_navigation_files()
+                self.match_navigation_files_to_project()
+            elif rerun_svp_file_match:
+                self.match_svp_files_to_project()
+
+            # adding any new files should trigger rebuilding the action tab
+            if updated_type:
+                self.update_matches()
 
         return updated_type, new_data, new_project
 
-    def remove_file(self, infile: str):
+    def add_files(self, infiles: list, silent: bool = True):
+        """
+        Bulk version of add_file.  The I/O bound gathers (multibeam header reads, sbet prefix reads, svp parses) fan
+        out across the gather pool while the intel module state is still mutated serially on this thread, and the
+        match rerun and action rebuild happen once for the whole batch instead of once per file.  The gathers release
+        the GIL in the stat/read syscalls, so wall time tracks the storage queue depth rather than the file count.
+
+        Parameters
+        ----------
+        infiles
+            list of full file paths to the new files
+        silent
+            if silent, will not print message on failing to add
+
+        Returns
+        -------
+        list
+            list of (updated_type, new_data, new_project) tuples, one per file, matching the add_file return values
+        """
+
+        infiles = [_normpath(infile) for infile in infiles]
+        futures = [self._gather_pool.submit(self._gather_file_info, infile, silent=silent) for infile in infiles]
+        results = []
+        for infile, future in zip(infiles, futures):
+            try:
+                gathered_data, intel_module, data_type, rerun_category = future.result()
+                results.append(self._register_file_info(infile, gathered_data, intel_module, data_type,
+                                                        rerun_category, defer_matches=True))
+            except Exception as e:
+                self.print_msg('Unable to load from file {}: {}'.format(infile, e), logging.ERROR)
+                results.append(('', None, False))
+        self.run_deferred_matches()
+        return results
+
+    def add_folder(self, folderpath: str, is_recursive: bool = True, silent: bool = True):
+        """
+        Add all supported files found under the provided folder.  Walks the directory tree with os.scandir, so the
+        file metadata comes from the directory read itself (the DirEntry stat results seed the basic file info cache)
+        instead of a separate stat call per file.
+
+        Parameters
+        ----------
+        folderpath
+            absolute folder path to the directory of files we want to add
+        is_recursive
+            if True, search subdirectories as well
+        silent
+            if silent, will not print message on failing to add
+
+        Returns
+        -------
+        list
+            list of the files that were added
+        """
+
+        folderpath = _normpath(folderpath)
+        if not os.path.isdir(folderpath):
+            self.print_msg('Unable to add folder, path provided is not a valid directory: {}'.format(folderpath),
+                           logging.ERROR)
+            return []
+        added_files = []
+        folders = [folderpath]
+        while folders:
+            with os.scandir(folders.pop()) as dir_entries:
+                for entry in dir_entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        if is_recursive:
+                            folders.append(entry.path)
+                    elif entry.is_file() and os.path.splitext(entry.name)[1].lower() in all_extensions:
+                        norm_filepath = _normpath(entry.path)
+                        _basic_info_from_stat(norm_filepath, entry.stat())  # seed the cache from the scandir metadata
+                        updated_type, new_data, new_project = self.add_file(norm_filepath, silent=silent)
+                        if updated_type:
+                            added_files.append(norm_filepath)
+        return added_files
+
+    def remove_file(self, infile: str, defer_matches: bool = False):
         """
         Remove this file from any intelligence modules
 
@@ -386,6 +679,8 @@ class FqprIntel(LoggerClass):
         ----------
         infile
             full file path to the file
+        defer_matches
+            if True, accumulate the match rerun for this file instead of running it now, see run_deferred_matches
 
         Returns
         -------
@@ -401,46 +696,74 @@ class FqprIntel(LoggerClass):
         rerun_nav_file_match = False
         rerun_svp_file_match = False
 
-        if infile in self.multibeam_intel.file_paths:
-            uid = self.multibeam_intel.remove_file(infile)
-            if uid:
-                rerun_mbes_file_match = True
-            updated_type = 'multibeam'
-        elif infile in self.svp_intel.file_paths:
-            uid = self.svp_intel.remove_file(infile)
-            if uid:
-                rerun_svp_file_match = True
-            updated_type = 'svp'
-        elif infile in self.nav_intel.file_paths:
-            uid = self.nav_intel.remove_file(infile)
-            if uid:
-                rerun_nav_file_match = True
-            updated_type = 'navigation'
-        elif infile in self.naverror_intel.file_paths:
-            uid = self.naverror_intel.remove_file(infile)
+        infile = _normpath(infile)  # intel modules and the reverse index key on normalized paths
+        invalidate_basic_file_info(infile)
+        entry = self._path_to_intel.pop(infile, None)
+        if entry is not None:
+            intel_module, data_type = entry
+            uid = intel_module.remove_file(infile)
+            updated_type = data_type
             if uid:
-                rerun_nav_file_match = True
-            updated_type = 'naverror'
-        elif infile in self.navlog_intel.file_paths:
-            uid = self.navlog_intel.remove_file(infile)
-            if uid:
-                rerun_nav_file_match = True
-            updated_type = 'navlog'
+                category = _rerun_category[data_type]
+                if category == 'mbes':
+                    rerun_mbes_file_match = True
+                elif category == 'svp':
+                    rerun_svp_file_match = True
+                else:
+                    rerun_nav_file_match = True
 
         # removed files, so lets rebuild the matches for the appropriate category
+        if defer_matches:
+            self._defer_match_rerun(updated_type, rerun_mbes_file_match, rerun_nav_file_match, rerun_svp_file_match)
+        else:
+            if rerun_mbes_file_match:
+                self.match_multibeam_files_to_project()
+            elif rerun_nav_file_match:
+                self.match_navigation_files()
+                self.match_navigation_files_to_project()
+            elif rerun_svp_file_match:
+                self.match_svp_files_to_project()
+
+            # removing any new files should trigger rebuilding the action tab
+            if updated_type:
+                self.update_matches()
+
+        return updated_type, uid
+
+    def _defer_match_rerun(self, updated_type: str, rerun_mbes_file_match: bool, rerun_nav_file_match: bool,
+                           rerun_svp_file_match: bool):
+        """
+        Record the match rerun that an add_file/remove_file call would have performed, so that a batch of changes can
+        run each match category at most once, see run_deferred_matches
+        """
+
         if rerun_mbes_file_match:
-            self.match_multibeam_files_to_project()
+            self._deferred_match_categories.add('mbes')
         elif rerun_nav_file_match:
-            self.match_navigation_files()
-            self.match_navigation_files_to_project()
+            self._deferred_match_categories.add('nav')
         elif rerun_svp_file_match:
-            self.match_svp_files_to_project()
-
-        # removing any new files should trigger rebuilding the action tab
+            self._deferred_match_categories.add('svp')
         if updated_type:
-            self.update_matches()
+            self._deferred_match_categories.add('actions')
 
-        return updated_type, uid
+    def run_deferred_matches(self):
+        """
+        Run the match reruns accumulated by add_file/remove_file calls made with defer_matches=True.  Each match
+        category runs at most once regardless of how many files were added or removed.
+        """
+
+        categories = self._deferred_match_categories
+        self._deferred_match_categories = set()
+        if not categories:
+            return
+        if 'mbes' in categories:
+            self.match_multibeam_files_to_project()
+        if 'nav' in categories:
+            self.match_navigation_files()
+            self.match_navigation_files_to_project()
+        if 'svp' in categories:
+            self.match_svp_files_to_project()
+        self.update_matches()
 
     def update_actions_client(self):
         """
@@ -448,26 +771,39 @@ class FqprIntel(LoggerClass):
         """
         self.action_container.update_actions_client(self.project.client)
 
-    def _regenerate_multibeam_actions(self):
+    def _regenerate_multibeam_actions(self, only_dirty: bool = False):
         """
         Update, add or remove multibeam actions based on the current multibeam intel line groups.  This gets run after every time
         a file is added or removed to the Intelligence class.
+
+        Parameters
+        ----------
+        only_dirty
+            if True, skip updating existing actions for destinations whose line group has not changed since the last
+            regeneration, only rebuilding the ones that actually differ
         """
 
         # use the buffered version to compare against the always updating line_groups.  Here we set them equal as we regenerate actions
-        self._buffered_multibeam_line_groups = deepcopy(self.multibeam_intel.line_groups)
+        previous_groups = self._buffered_multibeam_line_groups
+        self._buffered_multibeam_line_groups = _snapshot_groups(self.multibeam_intel.line_groups)
 
         # remove actions that do not match any fqpr instances that are in the project
         curr_acts, cur_dests = self.action_container.update_action_from_list('multibeam', list(self._buffered_multibeam_line_groups.keys()))
+        cur_dests = set(cur_dests)  # membership tested once per destination below
+        actions_by_destination = {}
+        for act in curr_acts:
+            if act.output_destination in actions_by_destination:
+                raise ValueError('{} actions found with the same destinations, {}'.format('Multibeam', act.output_destination))
+            actions_by_destination[act.output_destination] = act
 
         for destination, line_list in self._buffered_multibeam_line_groups.items():
             if destination in cur_dests:
-                action = [a for a in curr_acts if a.output_destination == destination]
-                if len(action) == 1:
+                if only_dirty and previous_groups.get(destination) == line_list:
+                    continue
+                action = actions_by_destination.get(destination)
+                if action is not None:
                     settings = fqpr_actions.update_kwargs_for_multibeam(destination, line_list, self.project.client, self.general_settings)
-                    self.action_container.update_action(action[0], **settings)
-                elif len(action) > 1:
-                    raise ValueError('Multibeam actions found with the same destinations, {}'.format(destination))
+                    self.action_container.update_action(action, **settings)
             else:
                 newaction = fqpr_actions.build_multibeam_action(destination, line_list, self.project.client, self.general_settings)
                 self.action_container.add_action(newaction)
@@ -478,64 +814,79 @@ class FqprIntel(LoggerClass):
         have a nav action, as the nav action is importing processed navigation into an fqpr instance.
         """
         # self._clear_actions_by_type('navigation')
-        self._buffered_nav_groups = deepcopy(self.nav_intel.nav_groups)
-        self._buffered_navlog_matching_sbet = deepcopy(self.navlog_intel.matching_sbet)
-        self._buffered_naverror_matching_sbet = deepcopy(self.naverror_intel.matching_sbet)
+        self._buffered_nav_groups = _snapshot_groups(self.nav_intel.nav_groups)
+        self._buffered_navlog_matching_sbet = _snapshot_groups(self.navlog_intel.matching_sbet)
+        self._buffered_naverror_matching_sbet = _snapshot_groups(self.naverror_intel.matching_sbet)
 
         # remove actions that do not match any fqpr instances that are in the project
         curr_acts, cur_dests = self.action_container.update_action_from_list('navigation', list(self._buffered_nav_groups.keys()))
-
+        cur_dests = set(cur_dests)  # membership tested once per destination below
+        actions_by_destination = {}
+        for act in curr_acts:
+            if act.output_destination in actions_by_destination:
+                raise ValueError('{} actions found with the same destinations, {}'.format('Navigation import', act.output_destination))
+            actions_by_destination[act.output_destination] = act
+
+        err_lookup = self.naverror_intel.sbet_lookup
+        log_lookup = self.navlog_intel.sbet_lookup
         for destination, navfiles in self._buffered_nav_groups.items():
             error_files = []
             log_files = []
             final_nav_files = []
             fqpr_instance = self.project.fqpr_instances[destination]
             for navfile in navfiles:
-                error_file = ''
-                log_file = ''
-                if navfile in self.naverror_intel.sbet_lookup:
-                    error_file = self.naverror_intel.sbet_lookup[navfile]
-                if navfile in self.navlog_intel.sbet_lookup:
-                    log_file = self.navlog_intel.sbet_lookup[navfile]
+                error_file = err_lookup.get(navfile, '')
+                log_file = log_lookup.get(navfile, '')
                 if error_file and log_file:
                     error_files.append(error_file)
                     log_files.append(log_file)
                     final_nav_files.append(navfile)
             
             if destination in cur_dests:
-                action = [a for a in curr_acts if a.output_destination == destination]
-                if len(action) == 1:
+                action = actions_by_destination.get(destination)
+                if action is not None:
                     if not final_nav_files:
-                        self.action_container.remove_action(action[0])
+                        self.action_container.remove_action(action)
                     else:
                         settings = fqpr_actions.update_kwargs_for_navigation(destination, fqpr_instance, final_nav_files, error_files, log_files)
-                        self.action_container.update_action(action[0], **settings)
-                elif len(action) > 1:
-                    raise ValueError('Navigation import actions found with the same destinations, {}'.format(destination))
+                        self.action_container.update_action(action, **settings)
             else:
                 newaction = fqpr_actions.build_nav_action(destination, fqpr_instance, final_nav_files, error_files, log_files)
                 self.action_container.add_action(newaction)
 
-    def _regenerate_svp_actions(self):
+    def _regenerate_svp_actions(self, only_dirty: bool = False):
         """
         Brute force currently, just import sv profile to all fqpr instances in the project.
+
+        Parameters
+        ----------
+        only_dirty
+            if True, skip updating existing actions for destinations whose svp group has not changed since the last
+            regeneration
         """
         # self._clear_actions_by_type('navigation')
-        self._buffered_svp_groups = deepcopy(self.svp_intel.svp_groups)
+        previous_groups = self._buffered_svp_groups
+        self._buffered_svp_groups = _snapshot_groups(self.svp_intel.svp_groups)
 
         # remove actions that do not match any fqpr instances that are in the project
         curr_acts, cur_dests = self.action_container.update_action_from_list('svp', list(self._buffered_svp_groups.keys()))
+        cur_dests = set(cur_dests)  # membership tested once per destination below
+        actions_by_destination = {}
+        for act in curr_acts:
+            if act.output_destination in actions_by_destination:
+                raise ValueError('{} actions found with the same destinations, {}'.format('Sound Velocity import', act.output_destination))
+            actions_by_destination[act.output_destination] = act
 
         for destination, svfiles in self._buffered_svp_groups.items():
             fqpr_instance = self.project.fqpr_instances[destination]
 
             if destination in cur_dests:
-                action = [a for a in curr_acts if a.output_destination == destination]
-                if len(action) == 1:
+                if only_dirty and previous_groups.get(destination) == svfiles:
+                    continue
+                action = actions_by_destination.get(destination)
+                if action is not None:
                     settings = fqpr_actions.update_kwargs_for_svp(destination, fqpr_instance, svfiles)
-                    self.action_container.update_action(action[0], **settings)
-                elif len(action) > 1:
-                    raise ValueError('Sound Velocity import actions found with the same destinations, {}'.format(destination))
+                    self.action_container.update_action(action, **settings)
             else:
                 newaction = fqpr_actions.build_svp_action(destination, fqpr_instance, svfiles)
                 self.action_container.add_action(newaction)
@@ -591,11 +942,11 @@ class FqprIntel(LoggerClass):
                     if new_waterline:
                         # data matches between vessel file and converted data, except converted data has a new waterline value
                         # update the vessel file with that new waterline value
-                        if len(list(new_xyzrph['waterline'].keys())) == 1:
+                        if len(new_xyzrph['waterline']) == 1:
                             for tstmp in new_xyzrph['waterline']:
                                 new_xyzrph['waterline'][tstmp] = new_waterline
-                            new_tstmp = list(existing_xyzrph['waterline'].keys())[0]
-                            existing_tstmp = list(new_xyzrph['waterline'].keys())[0]
+                            new_tstmp = next(iter(existing_xyzrph['waterline']))
+                            existing_tstmp = next(iter(new_xyzrph['waterline']))
                             for entry in new_xyzrph:
                                 existing_data = new_xyzrph[entry][existing_tstmp]
                                 new_xyzrph[entry].pop(existing_tstmp)
@@ -679,7 +1030,9 @@ class FqprIntel(LoggerClass):
         if self.project:
             vessel_file = self.project.return_vessel_file()
             existing_actions = self.action_container.return_actions_by_type('processing')
-            all_current_project_paths = [self.project.absolute_path_from_relative(pth) for pth in self.project.fqpr_instances]
+            abs_path_lookup = {pth: self.project.absolute_path_from_relative(pth) for pth in self.project.fqpr_instances}
+            all_current_project_paths = set(abs_path_lookup.values())
+            actions_by_destination = {a.output_destination: a for a in existing_actions}
             for action in existing_actions:
                 if action.action_type == 'processing' and action.output_destination not in all_current_project_paths:
                     self.action_container.remove_action(action)
@@ -691,8 +1044,8 @@ class FqprIntel(LoggerClass):
                     new_vert_ref = self.processing_settings['vert_ref']
                 else:
                     new_vert_ref = None
-                abs_path = self.project.absolute_path_from_relative(relative_path)
-                action = [a for a in existing_actions if a.output_destination == abs_path]
+                abs_path = abs_path_lookup[relative_path]
+                action = actions_by_destination.get(abs_path)
                 full_reprocess = reprocess_fqpr == relative_path
                 if full_reprocess:
                     process_mode = 'reprocess'
@@ -706,20 +1059,20 @@ class FqprIntel(LoggerClass):
                                                                 new_waterline=new_waterline is not None,
                                                                 new_tpu=not identical_tpu,
                                                                 process_mode=process_mode)
-                if len(action) == 1 and not action[0].is_running:  # modify the existing processing action
+                if action is not None and not action.is_running:  # modify the existing processing action
                     if kwargs == {}:
-                        self.action_container.remove_action(action[0])
+                        self.action_container.remove_action(action)
                     else:
                         settings = fqpr_actions.update_kwargs_for_processing(abs_path, args, kwargs, self.processing_settings,
                                                                              force_epsg=forced_coordinate_match)
-                        self.action_container.update_action(action[0], **settings)
+                        self.action_container.update_action(action, **settings)
                 else:  # if valid kwargs are returned, there is a new processing action to take
                     if kwargs != {}:
                         newaction = fqpr_actions.build_processing_action(abs_path, args, kwargs, self.processing_settings,
                                                                          force_epsg=forced_coordinate_match)
                         self.action_container.add_action(newaction)
         else:
-            print('FqprIntel: no project loaded, no processing actions constructed.')
+            self.print_msg('FqprIntel: no project loaded, no processing actions constructed.', logging.WARNING)
 
     def _build_unmatched_list(self):
         """
@@ -731,13 +1084,15 @@ class FqprIntel(LoggerClass):
             dictionary of all unmatched files (key) and the reason each is unmatched (value)
         """
 
-        output = OrderedDict()
+        output = {}
         output.update(self.multibeam_intel.unmatched_files)
         output.update(self.nav_intel.unmatched_files)
         output.update(self.naverror_intel.unmatched_files)
         output.update(self.navlog_intel.unmatched_files)
         output.update(self.svp_intel.unmatched_files)
-        self.action_container.update_unmatched(output)
+        if output != self._last_unmatched:  # only push to the action container when something actually changed
+            self._last_unmatched = output
+            self.action_container.update_unmatched(output)
 
     def regenerate_actions(self, reprocess_fqpr: str = None):
         """
@@ -764,13 +1119,13 @@ class FqprIntel(LoggerClass):
         """
 
         if self.multibeam_intel.line_groups != self._buffered_multibeam_line_groups:
-            self._regenerate_multibeam_actions()
+            self._regenerate_multibeam_actions(only_dirty=True)
         if (self.naverror_intel.matching_sbet != self._buffered_naverror_matching_sbet) or (
                 self.navlog_intel.matching_sbet != self._buffered_navlog_matching_sbet) or (
                 self.nav_intel.nav_groups != self._buffered_nav_groups):
             self._regenerate_nav_actions()
         if self.svp_intel.svp_groups != self._buffered_svp_groups:
-            self._regenerate_svp_actions()
+            self._regenerate_svp_actions(only_dirty=True)
         self._build_unmatched_list()
 
     def _match_log_file_to_nav(self):
@@ -781,14 +1136,13 @@ class FqprIntel(LoggerClass):
         - which sbet is closest to the export name in the log file
         """
 
-        self.navlog_intel.unmatched_files = {}
+        self.navlog_intel.unmatched_files.clear()
+        nav_names = list(self.nav_intel.file_name.values())
+        nav_paths = list(self.nav_intel.file_path.values())
         for log_name in self.navlog_intel.file_path:
             log_path = self.navlog_intel.file_path[log_name]
             log_export_name = self.navlog_intel.exported_sbet_file[log_path]
 
-            nav_names = list(self.nav_intel.file_name.values())
-            nav_paths = list(self.nav_intel.file_path.values())
-
             # try a match based on file name
             name_match = likelihood_file_name_match(nav_names, log_name)
             path_match = [self.nav_intel.file_path[name] for name in name_match]
@@ -801,25 +1155,15 @@ class FqprIntel(LoggerClass):
             path_match += [self.nav_intel.file_path[name] for name in name_match]
 
             if path_match:
-                most_likely = max(set(path_match), key=path_match.count)
+                most_likely = Counter(path_match).most_common(1)[0][0]
                 self.navlog_intel.matching_sbet[log_path] = most_likely
                 self.navlog_intel.sbet_lookup[most_likely] = log_path
 
                 # still produce an informational tool tip message to help the user
-                unmatched_reason = 'Navigation export log file (POSPac export log)\n\n'
-                unmatched_reason += 'Match with {}\nMatches are made using:\n\n'.format(most_likely)
-                unmatched_reason += '- matching characters between the error file path and the navigation file path\n'
-                unmatched_reason += '- file system location, nav files that are in the same directory as this error file are preferred\n'
-                unmatched_reason += '- the start and end time of the nav file, will prefer the closest error file in time\n'
-                self.navlog_intel.unmatched_files[log_path] = unmatched_reason
+                self.navlog_intel.unmatched_files[log_path] = _navlog_matched_reason.format(most_likely)
             else:
                 self.navlog_intel.matching_sbet[log_path] = ''
-                unmatched_reason = 'Navigation export log file (POSPac export log)\n\n'
-                unmatched_reason += 'No matching navigation file for this log file.\nMatches are made using:\n\n'
-                unmatched_reason += '- matching characters between the log file path and the navigation file path\n'
-                unmatched_reason += '- file system location, nav files that are in the same directory as this log file are preferred\n'
-                unmatched_reason += '- the export name in the log file, will prefer that file name for the matching navigation file\n'
-                self.navlog_intel.unmatched_files[log_path] = unmatched_reason
+                self.navlog_intel.unmatched_files[log_path] = _navlog_unmatched_reason
 
     def _match_error_file_to_nav(self):
         """
@@ -829,15 +1173,15 @@ class FqprIntel(LoggerClass):
         - which sbet has the closest start/end time to the error file start/end time
         """
 
-        self.naverror_intel.unmatched_files = {}
+        self.naverror_intel.unmatched_files.clear()
+        nav_names = list(self.nav_intel.file_name.values())
+        nav_paths = list(self.nav_intel.file_path.values())
+        sorted_nav_times = sorted((self.nav_intel.weekly_seconds_start[pth], self.nav_intel.weekly_seconds_end[pth], pth)
+                                  for pth in nav_paths)
         for err_name in self.naverror_intel.file_path:
             err_path = self.naverror_intel.file_path[err_name]
             err_time = [self.naverror_intel.weekly_seconds_start[err_path], self.naverror_intel.weekly_seconds_end[err_path]]
 
-            nav_names = list(self.nav_intel.file_name.values())
-            nav_paths = list(self.nav_intel.file_path.values())
-            nav_times = [[self.nav_intel.weekly_seconds_start[pth], self.nav_intel.weekly_seconds_end[pth]] for pth in nav_paths]
-
             # try a match based on file name
             name_match = likelihood_file_name_match(nav_names, err_name)
             path_match = [self.nav_intel.file_path[name] for name in name_match]
@@ -845,31 +1189,19 @@ class FqprIntel(LoggerClass):
             # try based on file system location (smrmsg might be right next to the sbet)
             path_match += likelihood_files_are_close(nav_paths, err_path)
 
-            # try based on the start/end time in weekly seconds
-            # this compare is a little bit different, returns the indices that match, no weekly time reverse lookup available
-            times_match_indices = likelihood_start_end_times_close(nav_times, err_time)
-            path_match += [nav_paths[idx] for idx in times_match_indices]
+            # try based on the start/end time in weekly seconds, bisecting the start-time sorted nav index
+            path_match += _paths_with_close_times(sorted_nav_times, err_time)
 
             if path_match:
-                most_likely = max(set(path_match), key=path_match.count)
+                most_likely = Counter(path_match).most_common(1)[0][0]
                 self.naverror_intel.matching_sbet[err_path] = most_likely
                 self.naverror_intel.sbet_lookup[most_likely] = err_path
 
                 # still produce an informational tool tip message to help the user
-                unmatched_reason = 'Navigation error file (POSPac smrmsg file)\n\n'
-                unmatched_reason += 'Match with {}\nMatches are made using:\n\n'.format(most_likely)
-                unmatched_reason += '- matching characters between the error file path and the navigation file path\n'
-                unmatched_reason += '- file system location, nav files that are in the same directory as this error file are preferred\n'
-                unmatched_reason += '- the start and end time of the nav file, will prefer the closest error file in time\n'
-                self.naverror_intel.unmatched_files[err_path] = unmatched_reason
+                self.naverror_intel.unmatched_files[err_path] = _naverror_matched_reason.format(most_likely)
             else:
                 self.naverror_intel.matching_sbet[err_path] = ''
-                unmatched_reason = 'Navigation error file (POSPac smrmsg file)\n\n'
-                unmatched_reason += 'No matching navigation file for this error file.\nMatches are made using:\n\n'
-                unmatched_reason += '- matching characters between the error file path and the navigation file path\n'
-                unmatched_reason += '- file system location, nav files that are in the same directory as this error file are preferred\n'
-                unmatched_reason += '- the start and end time of the nav file, will prefer the closest error file in time\n'
-                self.naverror_intel.unmatched_files[err_path] = unmatched_reason
+                self.naverror_intel.unmatched_files[err_path] = _naverror_unmatched_reason
 
     def match_navigation_files(self):
         """
@@ -884,7 +1216,7 @@ class FqprIntel(LoggerClass):
         self._match_log_file_to_nav()
         self._match_error_file_to_nav()
 
-    def match_multibeam_files_to_project(self):
+    def match_multibeam_files_to_project(self, restrict_to_new_instance: str = None):
         """
         Match multibeam files to one of the fqpr_instances in the project.  Assign the path to the matching fqpr_instance
         to the multibeam_intel matching_fqpr dictionary.  If there is no match, leave it blank.
@@ -893,16 +1225,39 @@ class FqprIntel(LoggerClass):
         to or the serial number identifier that we will use to create a new fqpr instance for these files.  Use the serial
         number group when the new multibeam files do not go with an existing fqpr instance (as the new serial numbers do
         not match any existing fqpr instance serial numbers).
+
+        Parameters
+        ----------
+        restrict_to_new_instance
+            optional, relative path of an fqpr instance that was just added to the project.  When set, files already
+            matched to an existing instance are left alone and only the files without a match are reexamined, see
+            update_intel_for_action_results
         """
 
         if not self.project:
-            print('FqprIntel: a project must be created before you can match multibeam files to project')
+            self.print_msg('FqprIntel: a project must be created before you can match multibeam files to project', logging.WARNING)
 
-        self.multibeam_intel.line_groups = {}
-        self.multibeam_intel.unmatched_files = {}
+        incremental = restrict_to_new_instance is not None
+        if not incremental:
+            self.multibeam_intel.line_groups.clear()
+            self.multibeam_intel._file_to_group.clear()
+            self.multibeam_intel.unmatched_files.clear()
         sorted_mfilepath = self.multibeam_intel.file_path_sorted_by_time()
+        project_dir = os.path.dirname(self.project.path) if self.project and self.project.path else ''
         for mfilepath in sorted_mfilepath:
             mfilename = self.multibeam_intel.file_name[mfilepath]
+            if incremental:
+                if self.multibeam_intel.matching_fqpr.get(mfilepath):
+                    continue  # already matched to a live instance, the new instance does not invalidate that
+                # previously grouped under a new-instance folder key, pull it out before rematching
+                previous_group = self.multibeam_intel._file_to_group.pop(mfilepath, None)
+                if previous_group is not None:
+                    linegroup = self.multibeam_intel.line_groups.get(previous_group)
+                    if linegroup is not None:
+                        if mfilepath in linegroup:
+                            linegroup.remove(mfilepath)
+                        if not linegroup:
+                            self.multibeam_intel.line_groups.pop(previous_group)
             if self.project:
                 start_time = self.multibeam_intel.data_start_time_utc[mfilepath]
                 prim_serial = self.multibeam_intel.primary_serial_number[mfilepath]
@@ -916,22 +1271,27 @@ class FqprIntel(LoggerClass):
                             self.multibeam_intel.line_groups[fqpr_path].append(mfilepath)
                         else:
                             self.multibeam_intel.line_groups[fqpr_path] = [mfilepath]
+                        self.multibeam_intel._file_to_group[mfilepath] = fqpr_path
                 else:  # add the file to the serial number container that will be used to build a new fqpr instance
                     self.multibeam_intel.matching_fqpr[mfilepath] = ''
-                    dte = start_time.strftime('%m_%d_%Y')
+                    dte = self.multibeam_intel.data_start_time_utc_datestr.get(mfilepath)
+                    if dte is None:  # strftime is surprisingly costly, format each file's start date only once
+                        dte = start_time.strftime('%m_%d_%Y')
+                        self.multibeam_intel.data_start_time_utc_datestr[mfilepath] = dte
                     folder_name = '{}_{}_{}'.format(model_number, prim_serial, dte)
-                    key = os.path.join(os.path.split(self.project.path)[0], folder_name)
+                    key = os.path.join(project_dir, folder_name)
                     if key in self.multibeam_intel.line_groups:
                         self.multibeam_intel.line_groups[key].append(mfilepath)
                     else:
                         self.multibeam_intel.line_groups[key] = [mfilepath]
+                    self.multibeam_intel._file_to_group[mfilepath] = key
             else:
                 self.multibeam_intel.matching_fqpr[mfilepath] = ''
                 unmatched_reason = 'Multibeam file\n\n'
                 unmatched_reason += 'No project found, a project must be setup first before matching multibeam files'
                 self.multibeam_intel.unmatched_files[mfilepath] = unmatched_reason
 
-    def match_navigation_files_to_project(self):
+    def match_navigation_files_to_project(self, restrict_to_new_instance: str = None):
         """
         Difficult to match processed navigation files to the fqpr instance.  POSPac SBET files are in weekly seconds,
         so it's not a matter of just getting the closest time match.  Also the SBET can be much longer than the
@@ -945,15 +1305,43 @@ class FqprIntel(LoggerClass):
         - Check weekly seconds and fqpr instance weekly seconds to see if sbet is on the same day.
         - Check the navfilepath for fqpr instance identifiers like serial number and model number
         - (TODO) look at getting a time/position from the multibeam and see if that is in the SBET with a close position
+
+        Parameters
+        ----------
+        restrict_to_new_instance
+            optional, relative path of an fqpr instance that was just added to the project.  When set, nav files
+            already matched to a live instance are skipped and only the unmatched files are reexamined
         """
 
         if not self.project:
-            print('FqprIntel: a project must be created before you can match multibeam files to project')
+            self.print_msg('FqprIntel: a project must be created before you can match multibeam files to project', logging.WARNING)
 
-        self.nav_intel.nav_groups = {}
-        self.nav_intel.unmatched_files = {}
+        incremental = restrict_to_new_instance is not None
+        if not incremental:
+            self.nav_intel.nav_groups.clear()
+            self.nav_intel._file_to_group.clear()
+            self.nav_intel.unmatched_files.clear()
         if self.project.fqpr_instances:
+            # pull the attributes we need out of each instance once, reading them through xarray for every nav file
+            #   is the expensive part of this match
+            instance_cache = {}
+            for relpath, fqpr_instance in self.project.fqpr_instances.items():
+                rp = fqpr_instance.multibeam.raw_ping[0]
+                starttime = float(rp.time[0].values)  # index first, .values on the full array pulls it all from disk
+                starttime_weekly = datetime.utcfromtimestamp(starttime) - datetime.strptime("1980-01-06 00:00:00", "%Y-%m-%d %H:%M:%S")
+                starttime_weekly = starttime_weekly.seconds + (86400 * (starttime_weekly.days % 7))
+                starttime_daynum = np.floor(starttime_weekly / 86400)
+                serial_lower = str(rp.system_identifier).lower()
+                model_lower = str(rp.sonartype).lower()
+                nav_files = set(rp.attrs['nav_files']) if 'nav_files' in rp.attrs else set()
+                instance_cache[relpath] = (starttime_daynum, serial_lower, model_lower, nav_files)
+            # instances routinely share serial/model strings, scan each unique identifier once per nav file and
+            #   award the votes by set lookup in the instance loop
+            identifier_keys = {ident for _, serial_lower, model_lower, _ in instance_cache.values()
+                               for ident in (serial_lower, model_lower)}
             for navfilepath, navfilename in self.nav_intel.file_name.items():
+                if incremental and self.nav_intel.matching_fqpr.get(navfilepath):
+                    continue  # already matched to a live instance, the new instance does not invalidate that
                 errfile = None
                 logfile = None
                 if navfilepath in self.naverror_intel.sbet_lookup:
@@ -961,44 +1349,41 @@ class FqprIntel(LoggerClass):
                 if navfilepath in self.navlog_intel.sbet_lookup:
                     logfile = self.navlog_intel.sbet_lookup[navfilepath]
                 if errfile and logfile:  # you need all three: sbet, error file, and log file
-                    fqpr_match = []
+                    scores = defaultdict(int)  # relpath -> number of match tests that voted for it
                     already_imported = None
                     sbet_starttime_weekly = self.nav_intel.weekly_seconds_start[navfilepath]
-                    for relpath, fqpr_instance in self.project.fqpr_instances.items():
-                        # skip navigation files that are already in this instance
-                        if 'nav_files' in fqpr_instance.multibeam.raw_ping[0].attrs and navfilename in fqpr_instance.multibeam.raw_ping[0].attrs['nav_files']:
+                    # cheap first pass, if any instance already holds this nav file the voting never runs
+                    for relpath, (_, _, _, nav_files) in instance_cache.items():
+                        if navfilename in nav_files:
                             already_imported = relpath
                             break
-
-                        starttime = fqpr_instance.multibeam.raw_ping[0].time.values[0]
-                        starttime_weekly = datetime.utcfromtimestamp(starttime) - datetime.strptime("1980-01-06 00:00:00", "%Y-%m-%d %H:%M:%S")
-                        starttime_weekly = starttime_weekly.seconds + (86400 * (starttime_weekly.days % 7))
-                        starttime_daynum = np.floor(starttime_weekly / 86400)
+                    if already_imported is None:
+                        navfilepath_lower = navfilepath.lower()
+                        identifier_hits = {ident for ident in identifier_keys if ident in navfilepath_lower}
                         sbet_starttime_weekly_daynum = np.floor(sbet_starttime_weekly / 86400)
+                        for relpath, (starttime_daynum, serial_lower, model_lower, _) in instance_cache.items():
+                            if sbet_starttime_weekly_daynum == starttime_daynum:  # sbet from same day of the week
+                                scores[relpath] += 1
 
-                        serial_number = fqpr_instance.multibeam.raw_ping[0].system_identifier
-                        model_number = fqpr_instance.multibeam.raw_ping[0].sonartype
-
-                        if sbet_starttime_weekly_daynum == starttime_daynum:  # sbet from same day of the week
-                            fqpr_match += [relpath]
-
-                        if navfilepath.lower().find(str(serial_number).lower()) != -1:
-                            fqpr_match += [relpath]
+                            if serial_lower in identifier_hits:
+                                scores[relpath] += 1
 
-                        if navfilepath.lower().find(str(model_number).lower()) != -1:
-                            fqpr_match += [relpath]
+                            if model_lower in identifier_hits:
+                                scores[relpath] += 1
                     if already_imported:
                         unmatch_reason = 'Navigation file (SBET)\n\n'
                         unmatch_reason += 'Supporting files exist:\n\nerror file: {}\nlogfile: {}\n\n'.format(errfile, logfile)
                         unmatch_reason += 'Files have already been imported in {}'.format(already_imported)
-                    elif fqpr_match:
+                    elif scores:
                         unmatch_reason = ''
-                        most_likely = max(set(fqpr_match), key=fqpr_match.count)
+                        most_likely = max(scores, key=scores.get)
                         self.nav_intel.matching_fqpr[navfilepath] = most_likely
                         if most_likely in self.nav_intel.nav_groups:
                             self.nav_intel.nav_groups[most_likely].append(navfilepath)
                         else:
                             self.nav_intel.nav_groups[most_likely] = [navfilepath]
+                        self.nav_intel._file_to_group[navfilepath] = most_likely
+                        self.nav_intel.unmatched_files.pop(navfilepath, None)  # no-op on a full rebuild
                     else:
                         unmatch_reason = 'Navigation file (SBET)\n\n'
                         unmatch_reason += 'Supporting files exist:\n\nerror file: {}\nlogfile: {}\n\n'.format(errfile, logfile)
@@ -1013,35 +1398,57 @@ class FqprIntel(LoggerClass):
                 if unmatch_reason:
                     self.nav_intel.matching_fqpr[navfilepath] = ''
                     self.nav_intel.unmatched_files[navfilepath] = unmatch_reason
-                    for fqpr_path in self.nav_intel.nav_groups:  # have to go through and remove the nav file from all preexisting matches
-                        if navfilepath in self.nav_intel.nav_groups[fqpr_path]:
-                            self.nav_intel.nav_groups[fqpr_path].remove(navfilepath)
+                    self._drop_nav_group_entry(navfilepath)
         else:
             for navfilepath, navfilename in self.nav_intel.file_name.items():
                 unmatch_reason = 'Navigation file (SBET)\n\n'
                 unmatch_reason += 'Converted multibeam data must exist to match navigation files'
                 self.nav_intel.matching_fqpr[navfilepath] = ''
                 self.nav_intel.unmatched_files[navfilepath] = unmatch_reason
-                for fqpr_path in self.nav_intel.nav_groups:  # have to go through and remove the nav file from all preexisting matches
-                    if navfilepath in self.nav_intel.nav_groups[fqpr_path]:
-                        self.nav_intel.nav_groups[fqpr_path].remove(navfilepath)
+                self._drop_nav_group_entry(navfilepath)
+
+    def _drop_nav_group_entry(self, navfilepath: str):
+        """
+        Remove a now-unmatched nav file from whichever nav group held it, using the nav module's inverse index instead
+        of scanning every group, see match_navigation_files_to_project
+        """
+
+        previous_group = self.nav_intel._file_to_group.pop(navfilepath, None)
+        if previous_group is not None:
+            navgroup = self.nav_intel.nav_groups.get(previous_group)
+            if navgroup is not None and navfilepath in navgroup:
+                navgroup.remove(navfilepath)
 
-    def match_svp_files_to_project(self):
+    def match_svp_files_to_project(self, restrict_to_new_instance: str = None):
         """
         This match is dead simple.  If the provided svp file is not in the project, we add it.
+
+        Parameters
+        ----------
+        restrict_to_new_instance
+            optional, relative path of an fqpr instance that was just added to the project.  When set, only check the
+            svp files against that instance, existing group entries are kept
         """
 
         if not self.project:
-            print('FqprIntel: a project must be created before you can match multibeam files to project')
+            self.print_msg('FqprIntel: a project must be created before you can match multibeam files to project', logging.WARNING)
 
-        self.svp_intel.svp_groups = {}
-        self.svp_intel.unmatched_files = {}
-        if self.project.fqpr_instances:
+        incremental = restrict_to_new_instance is not None
+        if incremental:
+            instances = {relpath: fqpr_instance for relpath, fqpr_instance in self.project.fqpr_instances.items()
+                         if relpath == restrict_to_new_instance}
+        else:
+            self.svp_intel.svp_groups.clear()
+            self.svp_intel.unmatched_files.clear()
+            instances = self.project.fqpr_instances
+        if instances:
+            # the cast dict only depends on the instance, build each instance's cast time set once for the whole pass
+            cast_times_by_instance = {relpath: {int(cast['time']) for cast in fqpr_instance.return_cast_dict().values()}
+                                      for relpath, fqpr_instance in instances.items()}
             for svpfilepath, svpfilename in self.svp_intel.file_name.items():
                 matched = False
-                for relpath, fqpr_instance in self.project.fqpr_instances.items():
-                    fqpr_casts = fqpr_instance.return_cast_dict()
-                    fqpr_cast_times = [int(fqpr_casts[castname]['time']) for castname in fqpr_casts]
+                for relpath in instances:
+                    fqpr_cast_times = cast_times_by_instance[relpath]
                     file_cast_times = self.svp_intel.time_utc_seconds[svpfilepath]  # list of cast times for each profile in file
                     if all(int(cd) in fqpr_cast_times for cd in file_cast_times):  # if any of the profiles in the file are new, load them
                         continue
@@ -1051,7 +1458,9 @@ class FqprIntel(LoggerClass):
                     else:
                         self.svp_intel.svp_groups[relpath] = [svpfilepath]
                     matched = True
-                if not matched:
+                if matched:
+                    self.svp_intel.unmatched_files.pop(svpfilepath, None)  # no-op on a full rebuild
+                elif not incremental or svpfilepath in self.svp_intel.unmatched_files:
                     unmatch_reason = 'Sound Velocity Profile file (.svp)\n\n'
                     unmatch_reason += 'All projects currently have these sound velocity profiles already.'
                     self.svp_intel.unmatched_files[svpfilepath] = unmatch_reason
@@ -1079,29 +1488,32 @@ class FqprIntel(LoggerClass):
                     self.parent.kluster_execute_action(self.action_container, 0)
                 else:
                     output = self.action_container.execute_action(idx)
-                    self.project.add_fqpr(output)
+                    relpath, _ = self.project.add_fqpr(output)
                     self.project.save_project()
-                    self.update_intel_for_action_results(action_type)
+                    self.update_intel_for_action_results(action_type, new_instance=relpath)
 
-    def update_intel_for_action_results(self, action_type: str):
+    def update_intel_for_action_results(self, action_type: str, new_instance: str = None):
         """
         After a new action, we need to rematch the files, especially if there are new converted fqpr instances in the
-        project.
+        project.  If we know the relative path of the instance the action produced, the rematch is incremental, only
+        files that were unmatched (or grouped for a new instance) are reexamined instead of rematching everything.
 
         Parameters
         ----------
         action_type
             the action type of the action that was executed, action type is an attribute of the FqprAction
+        new_instance
+            optional, relative path of the fqpr instance the action produced
         """
 
         if action_type == 'multibeam':  # generated a new fqpr instance, have to rematch to project
-            self.match_multibeam_files_to_project()
-            self.match_navigation_files_to_project()
-            self.match_svp_files_to_project()
+            self.match_multibeam_files_to_project(restrict_to_new_instance=new_instance)
+            self.match_navigation_files_to_project(restrict_to_new_instance=new_instance)
+            self.match_svp_files_to_project(restrict_to_new_instance=new_instance)
         elif action_type == 'navigation':
-            self.match_navigation_files_to_project()
+            self.match_navigation_files_to_project(restrict_to_new_instance=new_instance)
         elif action_type == 'svp':
-            self.match_svp_files_to_project()
+            self.match_svp_files_to_project(restrict_to_new_instance=new_instance)
         self.regenerate_actions()
 
     def clear(self):
@@ -1113,14 +1525,26 @@ class FqprIntel(LoggerClass):
         monitored_folders = list(self.monitors.keys())
         for fldrpath in monitored_folders:
             self.stop_folder_monitor(fldrpath)
+        with self._event_lock:
+            if self._event_flush_timer is not None:
+                self._event_flush_timer.cancel()
+                self._event_flush_timer = None
+            self._event_queue.clear()
+        # release the gather pool worker threads, the replacement pool spawns its threads lazily on first submit
+        #   so this is free if the intel object is never used again
+        self._gather_pool.shutdown(wait=False)
+        self._gather_pool = ThreadPoolExecutor(max_workers=min(8, os.cpu_count() or 1),
+                                               thread_name_prefix='intel_gather')
         for module in self.return_intel_modules():
             module.clear()
         self.unique_id = 0
-        self._buffered_multibeam_line_groups = {}
-        self._buffered_naverror_matching_sbet = {}
-        self._buffered_navlog_matching_sbet = {}
-        self._buffered_nav_groups = {}
-        self._buffered_svp_groups = {}
+        self._buffered_multibeam_line_groups.clear()
+        self._buffered_naverror_matching_sbet.clear()
+        self._buffered_navlog_matching_sbet.clear()
+        self._buffered_nav_groups.clear()
+        self._buffered_svp_groups.clear()
+        self._path_to_intel.clear()
+        self._last_unmatched = None
         self.action_container.clear()
 
 
@@ -1137,8 +1561,13 @@ class IntelModule(LoggerClass):
         super().__init__(**kwargs)
 
     def _initialize(self):
-        self.added_data = []  # each added OrderedDict are appended to self.added_data
+        self._dict_attrs = ()  # lazily built tuple of the dict attribute names, see remove_file
+        self._attr_dicts = None  # lazily built attribute name -> dict lookup, see add_dict
+        # canonical store of the full record for each added file, one insert per add and one pop per remove.  The
+        #   per-attribute dicts below are retained as the lookup interface the rest of Kluster uses.
+        self.records = {}  # {'C:\\data_dir\\fil.kmall': {...gathered attributes...}}
         self.file_paths = []  # list of all added filepaths ['C:\\data_dir\\fil.kmall']
+        self._file_paths_set = set()  # set mirror of file_paths, for o(1) membership tests
         self.file_path = {}  # {'fil.kmall': 'C:\\data_dir\\fil.kmall'}
         self.file_name = {}  # {'C:\\data_dir\\fil.kmall': 'fil.kmall'}
         self.unique_id_reverse = {}  # {0: 'C:\\data_dir\\fil.kmall'}
@@ -1147,21 +1576,27 @@ class IntelModule(LoggerClass):
         self.last_modified_time_utc = {}  # {'C:\\data_dir\\fil.kmall': datetime.datetime(2020, 9, 10, 13, 16, 54, 96522, tzinfo=datetime.timezone.utc)}
         self.created_time_utc = {}  # {'C:\\data_dir\\fil.kmall': datetime.datetime(2020, 11, 19, 15, 35, 1, 899690, tzinfo=datetime.timezone.utc)}
         self.file_size_kb = {}  # {'C:\\data_dir\\fil.kmall': 33106.004}
+        self.file_size_bytes = {}  # {'C:\\data_dir\\fil.kmall': 33900548}
         self.unique_id = {}  # {'C:\\data_dir\\fil.kmall': 0}
         self.unmatched_files = {}  # {'C:\\data_dir\\fil.kmall': 'Unmatched because...'}
+        # reverse index for the duplicate file check, see _check_files_same_size
+        self._name_size_index = {}  # {('fil.kmall', 33900548): 'C:\\data_dir\\fil.kmall'}
 
-    def _check_files_same_size(self, attributes: OrderedDict):
+    def _check_files_same_size(self, filename: str, file_size_bytes: int):
         """
-        Take in the new attribution for a potential newly added file (see add_dict) and see if this attribution matches
-        an existing file by file name and file size.  We assume that if those match, this attribution is a duplicate.
+        See if a potential newly added file (see add_dict) matches an existing file by file name and file size.  We
+        assume that if those match, this attribution is a duplicate.  The check is a single lookup against the
+        (file name, file size) keyed index maintained by add_dict/remove_file, no scan of the existing files.
 
         Have to check file names to ensure that we catch files that are added once from one location and are then moved
         to another location (the file path will change but the file name and size will be the same)
 
         Parameters
         ----------
-        attributes
-            attributes for the incoming file, see one of the gather_xxxx functions outside of the class
+        filename
+            file name of the incoming file, add_dict computes this already so we take it as an argument
+        file_size_bytes
+            exact file size in bytes of the incoming file
 
         Returns
         -------
@@ -1169,16 +1604,9 @@ class IntelModule(LoggerClass):
             if True, this is a duplicate set of attribution
         """
 
-        new_file_name = os.path.split(attributes['file_path'])[1]
-        new_file_size = attributes['file_size_kb']
-        if new_file_size in list(self.file_size_kb.values()):
-            old_file_paths = list(self.file_size_kb.keys())
-            for fpth in old_file_paths:
-                if self.file_size_kb[fpth] == new_file_size and os.path.split(fpth)[1] == new_file_name:
-                    return True
-        return False
+        return (filename, file_size_bytes) in self._name_size_index
 
-    def add_dict(self, attributes: OrderedDict):
+    def add_dict(self, attributes: dict):
         """
         Add an incoming dictionary to the intelligence module, if it is not in there already and is a valid set
 
@@ -1188,25 +1616,30 @@ class IntelModule(LoggerClass):
             attributes for the incoming file, see one of the gather_xxxx functions outside of the class
         """
 
-        if 'file_path' in list(attributes.keys()):
-            norm_filepath = os.path.normpath(attributes['file_path'])
-            filename = os.path.split(norm_filepath)[1]
-            if norm_filepath not in self.file_paths and not self._check_files_same_size(attributes):
-                self.added_data.append(attributes)
+        if 'file_path' in attributes:
+            norm_filepath = _normpath(attributes['file_path'])
+            filename = os.path.basename(norm_filepath)
+            if norm_filepath not in self._file_paths_set and not self._check_files_same_size(filename, attributes['file_size_bytes']):
+                self.records[norm_filepath] = attributes
                 self.file_paths.append(norm_filepath)
+                self._file_paths_set.add(norm_filepath)
                 self.file_path[filename] = norm_filepath
                 self.file_name[norm_filepath] = filename
                 self.unique_id_reverse[attributes['unique_id']] = norm_filepath
+                self._name_size_index[(filename, attributes['file_size_bytes'])] = norm_filepath
                 attributes['file_name'] = filename
+                if self._attr_dicts is None:  # the dict attributes are fixed per subclass, build the lookup once
+                    self._attr_dicts = {ky: val for ky, val in vars(self).items()
+                                        if isinstance(val, dict) and not ky.startswith('_')}
+                attr_dicts = self._attr_dicts
                 for ky, val in attributes.items():
                     if ky != 'file_path':  # we store file paths in a separate attribute
-                        try:
-                            attr = self.__getattribute__(ky)
+                        attr = attr_dicts.get(ky)
+                        if attr is not None:
                             attr[norm_filepath] = val
-                            self.__setattr__(ky, attr)
-                        except AttributeError:  # attributes key not in this class
+                        else:  # attributes key not in this class
                             self.print_msg('{} is not an attribute of this module'.format(ky), logging.WARNING)
-                self.print_msg('File {} added as {}'.format(norm_filepath, attributes['type']))
+                self.print_msg('File %s added as %s', logging.INFO, norm_filepath, attributes['type'])
                 return True
             else:
                 self.print_msg('Input data dictionary describes a file that already exists in Kluster Intelligence: {}'.format(attributes['file_path']), logging.ERROR)
@@ -1217,7 +1650,8 @@ class IntelModule(LoggerClass):
     def remove_file(self, filepath: str):
         """
         remove the provided filepath from the intelligence module, returns the unique id for this file so that we can
-        update the GUI if necessary
+        update the GUI if necessary.  The public dict attributes to clean are scanned from vars once per subclass and
+        cached, and the dicts are mutated in place, there is no per-key setattr.
 
         Parameters
         ----------
@@ -1230,31 +1664,26 @@ class IntelModule(LoggerClass):
             unique id for the file we removed, FqprIntel is generating the unique id
         """
 
-        norm_filepath = os.path.normpath(filepath)
-        if norm_filepath in self.file_paths:
+        norm_filepath = _normpath(filepath)
+        if norm_filepath in self._file_paths_set:
             uid = self.unique_id[norm_filepath]
-            for ky in vars(self):
-                attr = self.__getattribute__(ky)
-                if ky == 'added_data':  # added_data is a list of ordered dict for each entry
-                    matching_data = [dat for dat in attr if dat['file_path'] == norm_filepath]
-                    if len(matching_data) > 1:
-                        raise ValueError('IntelModule: found multiple added_data entries for one file')
-                    else:
-                        attr.remove(matching_data[0])
-                elif isinstance(attr, list):  # all other lists we just try and remove the file path, see file_paths
-                    if norm_filepath in attr:
-                        attr.remove(norm_filepath)
-                elif isinstance(attr, dict):
-                    filename = os.path.split(norm_filepath)[1]
-                    if norm_filepath in list(attr.keys()):  # most attributes are here
-                        attr.pop(norm_filepath)
-                    elif uid in list(attr.keys()):  # unique_id_reverse here
-                        attr.pop(uid)
-                    elif filename in list(attr.keys()):  # file_path
-                        attr.pop(filename)
-                self.__setattr__(ky, attr)
-
-            self.print_msg('File {} removed'.format(norm_filepath), logging.INFO)
+            self._file_paths_set.discard(norm_filepath)
+            filename = os.path.basename(norm_filepath)
+            self._name_size_index.pop((filename, self.file_size_bytes.get(norm_filepath)), None)
+            if not self._dict_attrs:  # the attribute names are fixed per subclass, only scan vars once
+                self._dict_attrs = tuple(ky for ky, val in vars(self).items()
+                                         if isinstance(val, dict) and not ky.startswith('_'))
+            self.file_paths.remove(norm_filepath)
+            for ky in self._dict_attrs:  # dicts are mutated in place, no reassignment necessary
+                attr = getattr(self, ky)
+                if norm_filepath in attr:  # most attributes are here
+                    attr.pop(norm_filepath)
+                elif uid in attr:  # unique_id_reverse here
+                    attr.pop(uid)
+                elif filename in attr:  # file_path
+                    attr.pop(filename)
+
+            self.print_msg('File %s removed', logging.INFO, norm_filepath)
             return uid
         else:
             self.print_msg('File {} is not in this module'.format(filepath))
@@ -1282,12 +1711,15 @@ class MultibeamModule(IntelModule):
         """
         super()._initialize()
         self.data_start_time_utc = {}  # {'C:\\data_dir\\fil.kmall': datetime.datetime(2020, 3, 17, 9, 48, 52, 577000, tzinfo=datetime.timezone.utc)}
+        # lazily filled strftime of data_start_time_utc, built at most once per file, see match_multibeam_files_to_project
+        self.data_start_time_utc_datestr = {}  # {'C:\\data_dir\\fil.kmall': '03_17_2020'}
         self.data_end_time_utc = {}  # {'C:\\data_dir\\fil.kmall': datetime.datetime(2020, 3, 17, 12, 55, 51, 577000, tzinfo=datetime.timezone.utc)}
         self.primary_serial_number = {}  # {'C:\\data_dir\\fil.kmall': 241}
         self.secondary_serial_number = {}  # {'C:\\data_dir\\fil.kmall': 0}
         self.sonar_model_number = {}  # {'C:\\data_dir\\fil.kmall': 'em710'}
         self.matching_fqpr = {}  # {'C:\\data_dir\\fil.kmall': 'C:\\data_dir\\converted\\em710_241'}
         self.line_groups = {}  # {'C:\\data_dir\\converted\\em710_241': ['C:\\data_dir\\fil.kmall', ...]}
+        self._file_to_group = {}  # inverse of line_groups, {'C:\\data_dir\\fil.kmall': 'C:\\data_dir\\converted\\em710_241'}
 
     def remove_file(self, filepath: str):
         """
@@ -1304,16 +1736,16 @@ class MultibeamModule(IntelModule):
             unique id for the file we removed, FqprIntel is generating the unique id
         """
         uid = super().remove_file(filepath)
-        remove_key = ''
         if uid is not None:
-            norm_filepath = os.path.normpath(filepath)
-            for destination, linegroup in self.line_groups.items():
-                if norm_filepath in linegroup:
-                    linegroup.remove(norm_filepath)
-                if not linegroup:
-                    remove_key = destination
-        if remove_key:
-            self.line_groups.pop(remove_key)
+            norm_filepath = _normpath(filepath)
+            destination = self._file_to_group.pop(norm_filepath, None)
+            if destination is not None:
+                linegroup = self.line_groups.get(destination)
+                if linegroup is not None:
+                    if norm_filepath in linegroup:
+                        linegroup.remove(norm_filepath)
+                    if not linegroup:
+                        self.line_groups.pop(destination)
         return uid
 
     def file_path_sorted_by_time(self):
@@ -1344,6 +1776,7 @@ class NavigationModule(IntelModule):
         self.weekly_seconds_end = {}  # {'C:\\data_dir\\sbet.out': 212847.0}
         self.matching_fqpr = {}  # {'C:\\data_dir\\sbet.out': 'C:\\data_dir\\converted\\em710_241'}
         self.nav_groups = {}  # {'C:\\data_dir\\converted\\em710_241': ['C:\\data_dir\\sbet.out', ...]}
+        self._file_to_group = {}  # inverse of nav_groups, {'C:\\data_dir\\sbet.out': 'C:\\data_dir\\converted\\em710_241'}
 
     def remove_file(self, filepath: str):
         """
@@ -1360,16 +1793,16 @@ class NavigationModule(IntelModule):
             unique id for the file we removed, FqprIntel is generating the unique id
         """
         uid = super().remove_file(filepath)
-        remove_key = ''
         if uid is not None:
-            norm_filepath = os.path.normpath(filepath)
-            for destination, navgroup in self.nav_groups.items():
-                if norm_filepath in navgroup:
-                    navgroup.remove(norm_filepath)
-                if not navgroup:
-                    remove_key = destination
-        if remove_key:
-            self.nav_groups.pop(remove_key)
+            norm_filepath = _normpath(filepath)
+            destination = self._file_to_group.pop(norm_filepath, None)
+            if destination is not None:
+                navgroup = self.nav_groups.get(destination)
+                if navgroup is not None:
+                    if norm_filepath in navgroup:
+                        navgroup.remove(norm_filepath)
+                    if not navgroup:
+                        self.nav_groups.pop(destination)
         return uid
 
 
@@ -1410,9 +1843,9 @@ class NavErrorModule(IntelModule):
         uid = super().remove_file(filepath)
         remove_key = ''
         if uid is not None:
-            norm_filepath = os.path.normpath(filepath)
+            norm_filepath = _normpath(filepath)
             for matching_sbet, errfile in self.sbet_lookup.items():
-                if os.path.normpath(errfile) == norm_filepath:
+                if _normpath(errfile) == norm_filepath:
                     remove_key = matching_sbet
         if remove_key:
             self.sbet_lookup.pop(remove_key)
@@ -1464,9 +1897,9 @@ class NavExportLogModule(IntelModule):
         uid = super().remove_file(filepath)
         remove_key = ''
         if uid is not None:
-            norm_filepath = os.path.normpath(filepath)
+            norm_filepath = _normpath(filepath)
             for matching_sbet, logfile in self.sbet_lookup.items():
-                if os.path.normpath(logfile) == norm_filepath:
+                if _normpath(logfile) == norm_filepath:
                     remove_key = matching_sbet
         if remove_key:
             self.sbet_lookup.pop(remove_key)
@@ -1518,22 +1951,128 @@ class SvpModule(IntelModule):
             unique id for the file we removed, FqprIntel is generating the unique id
         """
         uid = super().remove_file(filepath)
-        remove_key = ''
         if uid is not None:
-            norm_filepath = os.path.normpath(filepath)
-            for destination, svpgroup in self.svp_groups.items():
+            norm_filepath = _normpath(filepath)
+            for svpgroup in self.svp_groups.values():
                 if norm_filepath in svpgroup:
                     svpgroup.remove(norm_filepath)
-                if not svpgroup:
-                    remove_key = destination
-        if remove_key:
-            self.svp_groups.pop(remove_key)
+            self.svp_groups = {destination: svpgroup for destination, svpgroup in self.svp_groups.items() if svpgroup}
         return uid
 
 
+# bounded cache of gather_basic_file_info results keyed by file path, validated against st_mtime_ns.  Directory
+#   monitor churn (write-open, close, modify) gathers the same path repeatedly, the cache turns repeats into a
+#   stat + dict lookup.  Invalidated when the monitor reports a file deleted, see invalidate_basic_file_info
+_basic_info_cache = OrderedDict()  # {'C:\\data_dir\\fil.kmall': (st_mtime_ns, st_size, {...basic info...})}
+_basic_info_cache_max_entries = 4096
+
+
+# memoized results of the full gather_xxxx functions keyed by (path, st_mtime_ns, st_size), so re-adding an
+#   unchanged file skips the file open/parse entirely, see FqprIntel._gather_file_info.  Kept process-local on
+#   purpose: an on-disk cache would need locking across concurrent kluster sessions for little gain, since the
+#   expensive multibeam gathers are already header-only reads
+_gather_cache = OrderedDict()  # {('C:\\data_dir\\fil.kmall', 1605918954000000000, 33900548): {...gathered attributes...}}
+_gather_cache_max_entries = 1024
+
+# guards both caches above, they are hit from the gather pool worker threads as well as the main thread (a monitor
+#   flush can run created-file gathers on the pool while deleted events invalidate on the flush thread)
+_cache_lock = Lock()
+
+
+def invalidate_basic_file_info(filepath: str):
+    """
+    Drop the cached gather_basic_file_info and gather_xxxx results for this file path, used when a file is
+    removed/deleted
+
+    Parameters
+    ----------
+    filepath
+        full file path to a file
+    """
+
+    with _cache_lock:
+        _basic_info_cache.pop(filepath, None)
+        stale_keys = [ky for ky in _gather_cache if ky[0] == filepath]
+        for ky in stale_keys:
+            _gather_cache.pop(ky, None)
+
+
+@lru_cache(maxsize=4096)
+def _classify_nav_file(filepath: str, mtime_ns: int):
+    """
+    Classify an ambiguous post processed navigation file (sbet and smrmsg can share the same extension).  Both
+    is_sbet and is_smrmsg open and scan the file, so the result is cached keyed on (path, mtime); re-adding an
+    unchanged file costs a dict lookup instead of up to two file opens.
+
+    Parameters
+    ----------
+    filepath
+        full normalized file path to the file
+    mtime_ns
+        st_mtime_ns of the file, part of the cache key so edited files re-classify
+
+    Returns
+    -------
+    str
+        one of 'sbet', 'smrmsg' or None if the file is neither
+    """
+
+    from HSTB.kluster.fqpr_drivers import is_sbet, is_smrmsg
+
+    if is_sbet(filepath):
+        return 'sbet'
+    elif is_smrmsg(filepath):
+        return 'smrmsg'
+    return None
+
+
+def _cached_gather(gather_function, filepath: str):
+    """
+    Run one of the gather_xxxx functions through the module level memoization cache.  If the file is unchanged since
+    we last gathered (same mtime and size), return a copy of the cached result instead of re-opening and re-parsing
+    the file.
+
+    Parameters
+    ----------
+    gather_function
+        one of the gather_xxxx functions
+    filepath
+        full normalized file path to the file
+
+    Returns
+    -------
+    dict
+        dictionary object with all metadata related to the provided file
+    """
+
+    try:
+        stat_blob = os.stat(filepath)
+        key = (filepath, stat_blob.st_mtime_ns, stat_blob.st_size)
+    except FileNotFoundError:
+        key = None
+    if key is not None:
+        with _cache_lock:
+            cached = _gather_cache.get(key)
+            if cached is not None:
+                _gather_cache.move_to_end(key)
+        if cached is not None:  # cached entries are never mutated after insert, safe to copy outside the lock
+            data = deepcopy(cached)  # copy, the intel modules mutate the returned dict (unique_id, file_name)
+            data['time_added'] = datetime.now(tz=_utc)
+            return data
+    data = gather_function(filepath)
+    if key is not None and data:
+        cache_entry = deepcopy(data)
+        with _cache_lock:
+            _gather_cache[key] = cache_entry
+            if len(_gather_cache) > _gather_cache_max_entries:
+                _gather_cache.popitem(last=False)
+    return data
+
+
 def gather_basic_file_info(filename: str):
     """
-    Build out the basic file metadata that can be gathered from any file on the file system.
+    Build out the basic file metadata that can be gathered from any file on the file system.  Issues a single
+    os.stat call, which covers the existence/regular-file checks as well as the size and mtime attributes.
 
     Parameters
     ----------
@@ -1546,26 +2085,60 @@ def gather_basic_file_info(filename: str):
         basic file attributes as dict
     """
 
-    if not os.path.exists(filename):
+    # a single stat covers the exists/isfile checks and the metadata, important on network shares where every
+    #   stat-like call (os.path.exists, os.path.isfile) is a separate round trip
+    try:
+        stat_blob = os.stat(filename)
+    except FileNotFoundError:
         raise EnvironmentError('{} does not exist'.format(filename))
-    elif not os.path.isfile(filename):
+    if not stat_module.S_ISREG(stat_blob.st_mode):
         raise EnvironmentError('{} is not a file'.format(filename))
 
-    last_modified_time = None
-    created_time = None
-    filesize = None
-    time_added = None
+    with _cache_lock:
+        cached = _basic_info_cache.get(filename)
+        if cached is not None and cached[:2] == (stat_blob.st_mtime_ns, stat_blob.st_size):  # file unchanged since we last gathered
+            _basic_info_cache.move_to_end(filename)
+            info = dict(cached[2])
+        else:
+            info = None
+    if info is not None:
+        info['time_added'] = datetime.now(tz=_utc)
+        return info
+
+    return _basic_info_from_stat(filename, stat_blob)
 
-    try:
-        stat_blob = os.stat(filename)
-        last_modified_time = datetime.fromtimestamp(stat_blob.st_mtime, tz=timezone.utc)
-        created_time = datetime.fromtimestamp(stat_blob.st_ctime, tz=timezone.utc)
-        filesize = np.around(stat_blob.st_size / 1024, 3)  # size in kB
-        time_added = datetime.now(tz=timezone.utc)
-    except FileNotFoundError:
-        print('Unable to read from {}'.format(filename))
-    return {'file_path': filename, 'last_modified_time_utc': last_modified_time,
-            'created_time_utc': created_time, 'file_size_kb': filesize, 'time_added': time_added}
+
+def _basic_info_from_stat(filename: str, stat_blob: os.stat_result):
+    """
+    Build the gather_basic_file_info dict from an already retrieved stat result and cache it.  Split out so callers
+    that already hold a stat result (os.scandir DirEntry objects, see FqprIntel.add_folder) can avoid a second stat.
+
+    Parameters
+    ----------
+    filename
+        full file path to a file
+    stat_blob
+        stat result for the file
+
+    Returns
+    -------
+    dict
+        basic file attributes as dict
+    """
+
+    last_modified_time = _ts2dt(stat_blob.st_mtime, tz=_utc)
+    created_time = _ts2dt(stat_blob.st_ctime, tz=_utc)
+    filesize_bytes = stat_blob.st_size  # exact size in bytes, used for duplicate detection
+    filesize = round(stat_blob.st_size / 1024, 3)  # size in kB
+    time_added = datetime.now(tz=_utc)
+    info = {'file_path': filename, 'last_modified_time_utc': last_modified_time,
+            'created_time_utc': created_time, 'file_size_kb': filesize, 'file_size_bytes': filesize_bytes,
+            'time_added': time_added}
+    with _cache_lock:
+        _basic_info_cache[filename] = (stat_blob.st_mtime_ns, stat_blob.st_size, dict(info))
+        if len(_basic_info_cache) > _basic_info_cache_max_entries:
+            _basic_info_cache.popitem(last=False)
+    return info
 
 
 def gather_multibeam_info(multibeam_file: str):
@@ -1583,20 +2156,22 @@ def gather_multibeam_info(multibeam_file: str):
 
     Returns
     -------
-    OrderedDict
+    dict
         dictionary object with all metadata related to the provided multibeam file
     """
 
+    from HSTB.kluster.fqpr_drivers import fast_read_multibeam_metadata
+
     basic = gather_basic_file_info(multibeam_file)
     mtype, start_end, serialnums = fast_read_multibeam_metadata(multibeam_file)
-    info_data = OrderedDict({'file_path': basic['file_path'], 'type': mtype,
-                             'data_start_time_utc': datetime.fromtimestamp(start_end[0], tz=timezone.utc),
-                             'data_end_time_utc': datetime.fromtimestamp(start_end[1], tz=timezone.utc),
+    info_data = {'file_path': basic['file_path'], 'type': mtype,
+                             'data_start_time_utc': _ts2dt(start_end[0], tz=_utc),
+                             'data_end_time_utc': _ts2dt(start_end[1], tz=_utc),
                              'primary_serial_number': serialnums[0],
                              'secondary_serial_number': serialnums[1], 'sonar_model_number': serialnums[2],
                              'last_modified_time_utc': basic['last_modified_time_utc'],
                              'created_time_utc': basic['created_time_utc'], 'file_size_kb': basic['file_size_kb'],
-                             'time_added': basic['time_added']})
+                             'file_size_bytes': basic['file_size_bytes'], 'time_added': basic['time_added']}
     return info_data
 
 
@@ -1613,20 +2188,22 @@ def gather_navfile_info(ppnav_file: str):
 
     Returns
     -------
-    OrderedDict
+    dict
         dictionary object with all metadata related to the provided processed navigation file
     """
 
+    from HSTB.kluster.fqpr_drivers import fast_read_sbet_metadata
+
     basic = gather_basic_file_info(ppnav_file)
     tms = fast_read_sbet_metadata(ppnav_file)
     if tms is None:
         raise IOError('File ({}) is not a valid postprocessed navigation file'.format(ppnav_file))
     mtype = 'POSPac sbet'
-    info_data = OrderedDict({'file_path': basic['file_path'], 'type': mtype,
+    info_data = {'file_path': basic['file_path'], 'type': mtype,
                              'weekly_seconds_start': tms[0], 'weekly_seconds_end': tms[1],
                              'last_modified_time_utc': basic['last_modified_time_utc'],
                              'created_time_utc': basic['created_time_utc'], 'file_size_kb': basic['file_size_kb'],
-                             'time_added': basic['time_added']})
+                             'file_size_bytes': basic['file_size_bytes'], 'time_added': basic['time_added']}
     return info_data
 
 
@@ -1643,20 +2220,22 @@ def gather_naverrorfile_info(pperror_file: str):
 
     Returns
     -------
-    OrderedDict
+    dict
         dictionary object with all metadata related to the provided processed navigation file
     """
 
+    from HSTB.kluster.fqpr_drivers import fast_read_errorfile_metadata
+
     basic = gather_basic_file_info(pperror_file)
     tms = fast_read_errorfile_metadata(pperror_file)
     if tms is None:
         raise IOError('File ({}) is not a valid postprocessed error file'.format(pperror_file))
     mtype = 'POSPac smrmsg'
-    info_data = OrderedDict({'file_path': basic['file_path'], 'type': mtype,
+    info_data = {'file_path': basic['file_path'], 'type': mtype,
                              'weekly_seconds_start': tms[0], 'weekly_seconds_end': tms[1],
                              'last_modified_time_utc': basic['last_modified_time_utc'],
                              'created_time_utc': basic['created_time_utc'], 'file_size_kb': basic['file_size_kb'],
-                             'time_added': basic['time_added']})
+                             'file_size_bytes': basic['file_size_bytes'], 'time_added': basic['time_added']}
     return info_data
 
 
@@ -1673,19 +2252,21 @@ def gather_exportlogfile_info(exportlog_file: str):
 
     Returns
     -------
-    OrderedDict
+    dict
         dictionary object with all metadata related to the provided processed navigation file
     """
 
+    from HSTB.kluster.fqpr_drivers import read_pospac_export_log
+
     basic = gather_basic_file_info(exportlog_file)
     loginfo = read_pospac_export_log(exportlog_file)
     if loginfo is not None:
-        info_data = OrderedDict({'file_path': basic['file_path'], 'type': 'sbet_export_log',
+        info_data = {'file_path': basic['file_path'], 'type': 'sbet_export_log',
                                  'exported_sbet_file': loginfo['exported_sbet_file'],
                                  'mission_date': loginfo['sbet_mission_date'], 'datum': loginfo['sbet_datum'],
                                  'ellipsoid': loginfo['sbet_ellipsoid'], 'last_modified_time_utc': basic['last_modified_time_utc'],
                                  'created_time_utc': basic['created_time_utc'], 'file_size_kb': basic['file_size_kb'],
-                                 'time_added': basic['time_added']})
+                                 'file_size_bytes': basic['file_size_bytes'], 'time_added': basic['time_added']}
     else:
         return None
     return info_data
@@ -1702,14 +2283,20 @@ def gather_svp_info(svp_file: str):
 
     Returns
     -------
-    OrderedDict
+    dict
         dictionary object with all metadata related to the provided svp file
     """
 
+    from HSTB.kluster.fqpr_drivers import read_soundvelocity_file
+
     basic = gather_basic_file_info(svp_file)
     svp_dict = read_soundvelocity_file(svp_file)
-    formatted_time_utc = [datetime.fromtimestamp(tm, tz=timezone.utc) for tm in svp_dict['svp_time_utc']]
-    info_data = OrderedDict({'file_path': basic['file_path'], 'type': 'caris_svp', 'profiles': svp_dict['profiles'],
+    svp_times = svp_dict['svp_time_utc']
+    if len(svp_times) > 16:  # enough profiles that per-element datetime construction matters, do one vectorized pass
+        formatted_time_utc = list((np.asarray(svp_times, dtype=np.float64) * 1e9).astype('datetime64[ns]'))
+    else:
+        formatted_time_utc = [_ts2dt(tm, tz=_utc) for tm in svp_times]
+    info_data = {'file_path': basic['file_path'], 'type': 'caris_svp', 'profiles': svp_dict['profiles'],
                              'number_of_profiles': svp_dict['number_of_profiles'],
                              'number_of_layers': svp_dict['number_of_layers'],
                              'julian_day': svp_dict['svp_julian_day'], 'time_utc': formatted_time_utc,
@@ -1719,15 +2306,30 @@ def gather_svp_info(svp_file: str):
                              'utm_hemisphere': svp_dict['utm_hemisphere'],
                              'last_modified_time_utc': basic['last_modified_time_utc'],
                              'created_time_utc': basic['created_time_utc'], 'file_size_kb': basic['file_size_kb'],
-                             'time_added': basic['time_added']})
+                             'file_size_bytes': basic['file_size_bytes'], 'time_added': basic['time_added']}
     return info_data
 
 
+# dispatch table for FqprIntel.add_file, file extension -> (gather function, FqprIntel intel module attribute,
+#   data type, rerun match category).  Built here as the gather functions have to exist first.  The sbet extensions
+#   carry a None gather function, those require the is_sbet/is_smrmsg content check to disambiguate first.
+_ext_dispatch = {}
+for _ext in _mbes_extensions:
+    _ext_dispatch[_ext] = (gather_multibeam_info, 'multibeam_intel', 'multibeam', 'mbes')
+for _ext in _svp_extensions:
+    _ext_dispatch[_ext] = (gather_svp_info, 'svp_intel', 'svp', 'svp')
+for _ext in _export_log_extensions:
+    _ext_dispatch[_ext] = (gather_exportlogfile_info, 'navlog_intel', 'navlog', 'nav')
+for _ext in _sbet_extensions:
+    _ext_dispatch[_ext] = (None, '', 'sbet', 'nav')
+
+
 def likelihood_file_name_match(filenames: list, compare_file: str, cutoff: float = 0.6):
     """
-    Find the closest match to compare_file in the list of file names provided (filenames).  Use the excellent difflib
-    to do so. Only returns one valid match, the match of highest probability (that is greater than or equal to the cutoff
-    probability)
+    Find the closest match to compare_file in the list of file names provided (filenames).  Check for a plain
+    substring match first, then score with rapidfuzz if it is installed, falling back to the excellent difflib
+    otherwise.  Only returns one valid match, the match of highest probability (that is greater than or equal to the
+    cutoff probability)
 
     Parameters
     ----------
@@ -1744,6 +2346,14 @@ def likelihood_file_name_match(filenames: list, compare_file: str, cutoff: float
         one element list fo the closest match, or an empty list if no matches
 
     """
+    # an exact substring hit is as good a match as the scorer will find, skip the fuzzy compare entirely
+    for fname in filenames:
+        if fname and (fname in compare_file or compare_file in fname):
+            return [fname]
+    if rapidfuzz_process is not None:
+        mtch = rapidfuzz_process.extract(compare_file, filenames, scorer=rapidfuzz_fuzz.ratio, limit=1,
+                                         score_cutoff=cutoff * 100)
+        return [m[0] for m in mtch]
     mtch = get_close_matches(compare_file, filenames, n=1, cutoff=cutoff)
     return mtch
 
@@ -1770,11 +2380,8 @@ def likelihood_files_are_close(filepaths: list, compare_path: str):
         list of filepaths that are in the same directory as compare_path
 
     """
-    close_paths = []
-    for pth in filepaths:
-        if os.path.dirname(pth) == os.path.dirname(compare_path):
-            close_paths.append(pth)
-    return close_paths
+    compare_dir = os.path.dirname(compare_path)
+    return [pth for pth in filepaths if os.path.dirname(pth) == compare_dir]
 
 
 def likelihood_start_end_times_close(filetimes: list, compare_times: list, allowable_diff: int = 2):
@@ -1806,13 +2413,37 @@ def likelihood_start_end_times_close(filetimes: list, compare_times: list, allow
         list of the indices that are a valid match in filetimes or an empty list if no matches
     """
 
-    close_times = []
-    for cnt, tms in enumerate(filetimes):
-        start_diff = abs(tms[0] - compare_times[0])
-        end_diff = abs(tms[1] - compare_times[1])
-        if (start_diff <= allowable_diff) and (end_diff < allowable_diff):
-            close_times.append(cnt)
-    return close_times
+    if not filetimes:
+        return []
+    diffs = np.abs(np.asarray(filetimes, dtype=np.float64) - np.asarray(compare_times, dtype=np.float64))
+    mask = (diffs[:, 0] <= allowable_diff) & (diffs[:, 1] < allowable_diff)
+    return np.nonzero(mask)[0].tolist()
+
+
+def _paths_with_close_times(sorted_filetimes: list, compare_times: list, allowable_diff: int = 2):
+    """
+    Sorted-index version of likelihood_start_end_times_close.  sorted_filetimes is a list of (starttime, endtime, path)
+    tuples sorted by start time, built once per match pass.  We bisect to the narrow band of start times within
+    allowable_diff of the compare start time and only check the end times of those candidates.
+
+    Parameters
+    ----------
+    sorted_filetimes
+        list of (starttime, endtime, filepath) tuples sorted by start time
+    compare_times
+        list of start/end time for the file to compare
+    allowable_diff
+        maximum allowable difference between start or end times
+
+    Returns
+    -------
+    list
+        list of the file paths that are a valid match or an empty list if no matches
+    """
+
+    lo = bisect.bisect_left(sorted_filetimes, (compare_times[0] - allowable_diff,))
+    hi = bisect.bisect_right(sorted_filetimes, (compare_times[0] + allowable_diff, float('inf')))
+    return [pth for starttime, endtime, pth in sorted_filetimes[lo:hi] if abs(endtime - compare_times[1]) < allowable_diff]
 
 
 def intel_process(filname: Union[str, list], outfold: str = None, coord_system: str = 'WGS84',
@@ -1,5 +1,6 @@
 import numpy as np
-from copy import deepcopy
+from scipy.linalg import cho_factor, cho_solve
+from scipy.linalg.blas import dsyrk
 from time import perf_counter
 import matplotlib.pyplot as plt
 
@@ -7,6 +8,7 @@ from bathygrid.convenience import create_grid
 from HSTB.kluster.fqpr_convenience import reprocess_sounding_selection
 from HSTB.kluster import kluster_variables
 from HSTB.kluster.fqpr_helpers import seconds_to_formatted_string
+from HSTB.kluster.numba_helpers import rotate_points_inplace, both_valid_mask
 
 
 class PatchTest:
@@ -64,11 +66,23 @@ class PatchTest:
         self._convert_parameters()
 
         self.multibeam_files = self.fqpr.multibeam.raw_ping[0].multibeam_files  # lookup for time/position/azimuth for each line
+        # these do not change between patch test iterations, cache them once instead of pulling from the xarray
+        # datasets on each of the three reprocessing runs
+        self._ra = self.fqpr.multibeam.raw_ping[self.sonar_head_index]
+        self._ra_time = np.asarray(self._ra.time.values)
+        self._mfiles = self.fqpr.return_line_dict()
+        # reprocessing only regenerates the georeferenced answer, the detection flags are untouched, so the
+        # good soundings mask can be built once as well
+        self._good_soundings = (self._ra.detectioninfo != kluster_variables.rejected_flag).values
         self.multibeam_indexes = None  # the integer index of the line to look up the corresponding points
-        self.points = None  # numpy structured array of all the rotated points we use
+        # the rotated points we use, kept as separate contiguous x/y/z arrays so the rotation kernel and the
+        # min/max reductions can vectorize, a structured record view is only built where bathygrid requires one
+        self._x = None
+        self._y = None
+        self._z = None
         self.min_x = None  # the minimum easting of the points
         self.min_y = None  # the minimum northing of the points
-        self.grid = None  # the grid corresponding to the current run, gridded Bathygrid object made with self.points
+        self.grid = None  # the grid corresponding to the current run, gridded Bathygrid object made with the point arrays
         self.a_matrix = None  # the A matrix for the least squares run
         self.b_matrix = None  # the B matrix for the least squares run
         self.lstsq_result = None  # the result of the least squares run, contains the patch test parameter delta for each line for each parameter
@@ -137,7 +151,12 @@ class PatchTest:
                                    'y_unc': float(initial_parameters['y_offset_error'][self.xyzrph_timestamp]),
                                    'hscale_factor': 0.0,
                                    'hscale_unc': 0.01}
-        self.current_parameters = deepcopy(self.initial_parameters)
+        self.current_parameters = self.initial_parameters.copy()  # flat dict of floats, no need for a deepcopy
+        # diagonal of the p_two weight matrix for the least squares run, built once here from the initial
+        # parameter uncertainties rather than on every iteration
+        self._p_two_diag = np.array([1 / self.initial_parameters['roll_unc'] ** 2, 1 / self.initial_parameters['pitch_unc'] ** 2,
+                                     1 / self.initial_parameters['heading_unc'] ** 2, 1 / self.initial_parameters['x_unc'],
+                                     1 / self.initial_parameters['y_unc'] ** 2, 1 / self.initial_parameters['hscale_unc']])
 
     def _compute_reliability(self, roll, pitch, heading, x_offset, y_offset, hscale_factor):
         """
@@ -168,24 +187,21 @@ class PatchTest:
         if not self.updated_parameters:  # this is the first run
             self.reliability_factors.append([0.0, 0.0, 0.0, 0.0, 0.0, 0.0])
         else:
-            newadjust = [roll, pitch, heading, x_offset, y_offset, hscale_factor]
-            curvals = [self.current_parameters['roll'], self.current_parameters['pitch'], self.current_parameters['heading'],
-                       self.current_parameters['x_offset'], self.current_parameters['y_offset'], self.current_parameters['hscale_factor']]
-            rfactors = []
-            for adjust, newadjust, curval in zip(self.last_adjustment, newadjust, curvals):
-                if curval == 0:
-                    rfactor = 0
-                else:
-                    rfactor = max(min(1 - np.abs((adjust - newadjust) / curval), 1), 0)
-                    if np.isnan(rfactor):
-                        rfactor = 0
-                rfactors.append(rfactor)
-            self.reliability_factors.append(rfactors)
+            newadjust = np.array([roll, pitch, heading, x_offset, y_offset, hscale_factor])
+            curvals = np.array([self.current_parameters['roll'], self.current_parameters['pitch'], self.current_parameters['heading'],
+                                self.current_parameters['x_offset'], self.current_parameters['y_offset'], self.current_parameters['hscale_factor']])
+            lastadjust = np.asarray(self.last_adjustment)
+            # compute all six factors in one vectorized pass, parameters with a zero current value or a nan
+            # result (divide by zero) get a zero reliability factor
+            with np.errstate(divide='ignore', invalid='ignore'):
+                rfactors = np.clip(1 - np.abs((lastadjust - newadjust) / curvals), 0, 1)
+            rfactors[(curvals == 0) | np.isnan(rfactors)] = 0.0
+            self.reliability_factors.append(rfactors.tolist())
 
     def _compute_covariance_matrix(self, finalz):
         try:
             # unit weight is the sum of the residuals divided by the number of points minus the number of parameters
-            unit_weight = np.sum(np.abs(self.points['z'] - finalz)) / (len(finalz) - 6)
+            unit_weight = np.sum(np.abs(self._z - finalz)) / (len(finalz) - 6)
             var_covar = unit_weight * np.linalg.inv(self.a_matrix)
             # variances are on the diagonal of the variance_covariance matrix
             self.variance.append([var_covar[0][0], var_covar[1][1], var_covar[2][2],
@@ -246,59 +262,90 @@ class PatchTest:
     def _build_initial_points(self):
         """
         The first run, we can pull the points from the currently loaded Fqpr object and store them in the points
-        numpy structured array.  We keep a multibeam_indexes lookup so that we can know which points go with which line
+        x/y/z arrays.  We keep a multibeam_indexes lookup so that we can know which points go with which line
         file.  This is important later in constructing the L1 matrix.
         """
 
-        curr_point_index = 0
-        finalx = None
-        finaly = None
-        finalz = None
-        self.points = None
+        self._x = None
+        self._y = None
+        self._z = None
         self.multibeam_indexes = {}
+        linenames = []
+        xs, ys, zs, lengths = [], [], [], []
         for mfilename in self.multibeam_files.keys():
             data = self.fqpr.subset_variables_by_line(['x', 'y', 'z'], mfilename, filter_by_detection=True)[mfilename]
             x, y, z = data.x.values, data.y.values, data.z.values
-            self.multibeam_indexes[mfilename] = [curr_point_index, curr_point_index + x.size]
-            curr_point_index = curr_point_index + x.size
-            if finalx is None:
-                finalx = x
-                finaly = y
-                finalz = z
-            else:
-                finalx = np.concatenate([finalx, x])
-                finaly = np.concatenate([finaly, y])
-                finalz = np.concatenate([finalz, z])
-        if finalx.any():
-            dtyp = [('x', np.float64), ('y', np.float64), ('z', np.float32)]
-            self.points = np.empty(len(finalx), dtype=dtyp)
-            self.points['x'] = finalx
-            self.points['y'] = finaly
-            self.points['z'] = finalz
+            linenames.append(mfilename)
+            xs.append(x)
+            ys.append(y)
+            zs.append(z)
+            lengths.append(x.size)
+        total_points = int(np.sum(lengths))
+        if total_points:
+            # allocate the full point arrays once and copy each line's data in a single time, the cumulative line
+            # lengths give us the multibeam_indexes directly
+            self._allocate_points(total_points)
+            offsets = np.concatenate([[0], np.cumsum(lengths)])
+            for cnt, linename in enumerate(linenames):
+                strt, end = int(offsets[cnt]), int(offsets[cnt + 1])
+                self.multibeam_indexes[linename] = [strt, end]
+                self._x[strt:end] = xs[cnt]
+                self._y[strt:end] = ys[cnt]
+                self._z[strt:end] = zs[cnt]
+
+    def _allocate_points(self, total_points: int):
+        """
+        Allocate the x/y/z point arrays for the given total point count.  We store the points as three plain
+        contiguous arrays rather than one structured array, the interleaved 20 byte records of the structured form
+        prevent vectorized loads in the rotation kernel and the numpy reductions that only touch one axis.
+
+        Parameters
+        ----------
+        total_points
+            total number of soundings across all lines
+        """
+
+        self._x = np.empty(total_points, dtype=np.float64)
+        self._y = np.empty(total_points, dtype=np.float64)
+        self._z = np.empty(total_points, dtype=np.float32)
+
+    @staticmethod
+    def _return_mean_adjustments(lstsq_result: np.ndarray):
+        """
+        Average the least squares result across the lines to get the six adjustment values.  lstsq_result is of
+        shape (6, 2), one column per line, rows in order of roll, pitch, heading, x translation, y translation and
+        horizontal scale factor.  Note that the horizontal scale factor comes from row 5, it previously duplicated
+        row 4 (the y translation row).
+
+        Parameters
+        ----------
+        lstsq_result
+            (6, 2) least squares result, see _compute_least_squares
+
+        Returns
+        -------
+        tuple
+            (roll, pitch, heading, x_translation, y_translation, hscale_factor) adjustment values as floats
+        """
+
+        means = np.asarray(lstsq_result).mean(axis=1)
+        roll, pitch, heading, x_translation, y_translation = np.round(means[:5], 4).tolist()
+        hscale_factor = round(float(means[5]), 5)
+        return roll, pitch, heading, x_translation, y_translation, hscale_factor
 
     def _reprocess_points(self):
         """
         Add the latest adjustment values to the Fqpr xyzrph record and reprocess with those values.  We reprocess using
         the in-memory workflow in Kluster, which means the results of the reprocessing (new georeferenced values) are not
         saved to disk, they are kept in the intermediate_data lookup.  Pull out those values and clear the computed Kluster
-        result.  The new points are kept in the points numpy structured array for the next least squares operation.
+        result.  The new points are kept in the x/y/z point arrays for the next least squares operation.
         """
 
-        roll = np.round(float(np.mean(self.lstsq_result[0])), 4)
-        pitch = np.round(float(np.mean(self.lstsq_result[1])), 4)
-        heading = np.round(float(np.mean(self.lstsq_result[2])), 4)
-        x_translation = np.round(float(np.mean(self.lstsq_result[3])), 4)
-        y_translation = np.round(float(np.mean(self.lstsq_result[4])), 4)
-        hscale_factor = np.round(float(np.mean(self.lstsq_result[4])), 5)
+        roll, pitch, heading, x_translation, y_translation, hscale_factor = self._return_mean_adjustments(self.lstsq_result)
         self._adjust_original_xyzrph(roll, pitch, heading, x_translation, y_translation, hscale_factor)
         newfq, _ = reprocess_sounding_selection(self.fqpr, georeference=True, turn_off_dask=False)
 
-        curr_point_index = 0
-        finalx = None
-        finaly = None
-        finalz = None
         cached_data = None
-        ra = self.fqpr.multibeam.raw_ping[self.sonar_head_index]
         for sector in newfq.intermediate_dat:
             if 'georef' in newfq.intermediate_dat[sector]:
                 for tstmp in newfq.intermediate_dat[sector]['georef']:
@@ -309,34 +356,44 @@ class PatchTest:
         if cached_data is None:
             raise ValueError('PatchTest: reprocessing failed, no cached data found')
 
-        mfiles = self.fqpr.return_line_dict()
-        good_soundings = ra.detectioninfo != kluster_variables.rejected_flag
+        mfiles = self._mfiles
+        good_soundings = self._good_soundings
+        # concatenate the cached georeferenced answer once up front, the line loop then only slices it
+        all_x = np.concatenate([c[0][0] for c in cached_data])
+        all_y = np.concatenate([c[0][1] for c in cached_data])
+        all_z = np.concatenate([c[0][2] for c in cached_data])
+        ra_times = self._ra_time
+        linenames = []
+        xs, ys, zs, lengths = [], [], [], []
         for linename in mfiles.keys():
             starttime, endtime = mfiles[linename][0], mfiles[linename][1]
-            # valid_index would be the boolean mask for the line we are currently looking at
-            valid_index = np.logical_and(ra.time >= float(starttime), ra.time <= float(endtime))
-            valid_goodsoundings = good_soundings[valid_index, :]
-            x = np.concatenate([c[0][0] for c in cached_data])[valid_index, :][valid_goodsoundings]
-            y = np.concatenate([c[0][1] for c in cached_data])[valid_index, :][valid_goodsoundings]
-            z = np.concatenate([c[0][2] for c in cached_data])[valid_index, :][valid_goodsoundings]
-            self.multibeam_indexes[linename] = [curr_point_index, curr_point_index + x.size]
-            curr_point_index = curr_point_index + x.size
-            if finalx is None:
-                finalx = np.ravel(x)
-                finaly = np.ravel(y)
-                finalz = np.ravel(z)
-            else:
-                finalx = np.concatenate([finalx, x])
-                finaly = np.concatenate([finaly, y])
-                finalz = np.concatenate([finalz, z])
+            # ping times are monotonically increasing, so each line is a contiguous slice of pings, searchsorted
+            # gives us the start/end indexes without building boolean masks over the full time array
+            strt = int(np.searchsorted(ra_times, float(starttime), side='left'))
+            end = int(np.searchsorted(ra_times, float(endtime), side='right'))
+            valid_goodsoundings = good_soundings[strt:end, :]
+            x = all_x[strt:end, :][valid_goodsoundings]
+            y = all_y[strt:end, :][valid_goodsoundings]
+            z = all_z[strt:end, :][valid_goodsoundings]
+            linenames.append(linename)
+            xs.append(x)
+            ys.append(y)
+            zs.append(z)
+            lengths.append(x.size)
         self.fqpr.intermediate_dat = {}
-        if finalx.any():
-            self._compute_covariance_matrix(finalz)
-            dtyp = [('x', np.float64), ('y', np.float64), ('z', np.float32)]
-            self.points = np.empty(len(finalx), dtype=dtyp)
-            self.points['x'] = finalx
-            self.points['y'] = finaly
-            self.points['z'] = finalz
+        total_points = int(np.sum(lengths))
+        if total_points:
+            self._compute_covariance_matrix(np.concatenate(zs))
+            # allocate the full point arrays once and copy each line's data in a single time, the cumulative line
+            # lengths give us the multibeam_indexes directly
+            self._allocate_points(total_points)
+            offsets = np.concatenate([[0], np.cumsum(lengths)])
+            for cnt, linename in enumerate(linenames):
+                strt, end = int(offsets[cnt]), int(offsets[cnt + 1])
+                self.multibeam_indexes[linename] = [strt, end]
+                self._x[strt:end] = xs[cnt]
+                self._y[strt:end] = ys[cnt]
+                self._z[strt:end] = zs[cnt]
 
     def _generate_rotated_points(self):
         """
@@ -354,7 +411,7 @@ class PatchTest:
         to get positive to starboard and normalize both northings and eastings to get xy values in the new model coordinate
         system.
 
-        The result is stored in the self.points attribute as a new structured numpy array.
+        The result is stored back into the x/y point arrays.
         """
 
         ang = self.azimuth - 90  # rotations are counter clockwise, we want it eventually facing east
@@ -362,25 +419,23 @@ class PatchTest:
         sin_az = np.sin(np.deg2rad(ang))
 
         print('Rotating points by {} degrees...'.format(ang))
-        if self.points is not None:
-            # normalize the y axis
-            self.points['y'] = self.points['y'] - self.points['y'].min()
+        if self._x is not None:
+            x = self._x
+            y = self._y
 
-            # normalize the x axis
-            self.points['x'] = self.points['x'] - self.points['x'].min()
-
-            # calculate center of rotation, use the origin of the points
+            # normalize both axes, the center of rotation is then the origin of the points
+            np.subtract(x, x.min(), out=x)
+            np.subtract(y, y.min(), out=y)
             self.min_x = 0
             self.min_y = 0
-            origin_x = self.points['x'] - self.min_x
-            origin_y = self.points['y'] - self.min_y
 
-            # rotate according to the provided line azimuth
-            self.points['x'] = self.min_x + cos_az * origin_x - sin_az * origin_y
-            self.points['y'] = self.min_y + sin_az * origin_x + cos_az * origin_y
+            # rotate according to the provided line azimuth, writing back into the point arrays in place.  The
+            # compiled kernel fuses the rotation equations into one parallel pass over the points, so no
+            # temporary arrays are allocated for these potentially very large arrays
+            rotate_points_inplace(x, y, self.min_x, self.min_y, cos_az, sin_az)
 
             # flip the y axis to make it +x forward, +y starboard, +z down
-            # self.points['y'] = self.points['y'].max() - self.points['y']
+            # np.subtract(y.max(), y, out=y)
 
         else:
             print('Found no valid points for {}'.format(list(self.multibeam_files.keys())))
@@ -392,12 +447,18 @@ class PatchTest:
         the gridded depth values for each line later.
         """
 
-        if self.points is not None and self.points.size > 0:
-            print('Building in memory grid for {} soundings...'.format(self.points.size))
+        if self._x is not None and self._x.size > 0:
+            print('Building in memory grid for {} soundings...'.format(self._x.size))
             grid_class = create_grid(grid_type='single_resolution')
+            dtyp = [('x', np.float64), ('y', np.float64), ('z', np.float32)]
             for linename in self.multibeam_indexes:
                 idxs = self.multibeam_indexes[linename]
-                grid_class.add_points(self.points[idxs[0]:idxs[1]], linename, [linename], progress_bar=False)
+                # bathygrid expects a structured array, build the record view for just this line's chunk
+                rec = np.empty(idxs[1] - idxs[0], dtype=dtyp)
+                rec['x'] = self._x[idxs[0]:idxs[1]]
+                rec['y'] = self._y[idxs[0]:idxs[1]]
+                rec['z'] = self._z[idxs[0]:idxs[1]]
+                grid_class.add_points(rec, linename, [linename], progress_bar=False)
             grid_class.grid(progress_bar=False)
             self.grid = grid_class
 
@@ -424,46 +485,55 @@ class PatchTest:
             dpth, xslope, yslope, lineone, linetwo = self.grid.get_layers_by_name(['depth', 'x_slope', 'y_slope', line_layers[0], line_layers[1]])
             self._plot_grid_layer_slope(xslope, 'xslope {}'.format(len(self.reliability_factors)))
             self._plot_grid_layer_slope(yslope, 'yslope {}'.format(len(self.reliability_factors)))
-            valid_index = np.logical_and(~np.isnan(lineone), ~np.isnan(linetwo))
+            valid_index = both_valid_mask(lineone, linetwo)
             if valid_index.any():
-                xval = np.arange(self.grid.min_x, self.grid.max_x, self.grid.resolutions[0])
-                yval = np.arange(self.grid.min_y, self.grid.max_y, self.grid.resolutions[0])
                 grid_rez = self.grid.resolutions[0]
-                # compute the x and y node locations for each grid node in the grid
-                x_node_locs, y_node_locs = np.meshgrid(xval + grid_rez / 2, yval + grid_rez / 2, copy=False)
+                # the y node location for each valid grid node comes straight from its row index, so we can skip
+                # building full meshgrid arrays only to throw most of the values away with the mask
+                node_rows, node_cols = np.nonzero(valid_index)
+                y_node_valid = self.grid.min_y + (node_rows + 0.5) * grid_rez  # y coordinate for all grid nodes where both lines overlap
 
-                dpth_valid = dpth[valid_index]  # grid depth for all grid nodes where both lines overlap
-                y_node_valid = y_node_locs[valid_index]  # y coordinate for all grid nodes where both lines overlap
-                xslope_valid = xslope[valid_index]  # grid slope partial x for all grid nodes where both lines overlap
-                yslope_valid = yslope[valid_index]  # grid slope partial y for all grid nodes where both lines overlap
-                lineone_valid = lineone[valid_index]  # grid depth for line one for all grid nodes where both lines overlap
-                linetwo_valid = linetwo[valid_index]  # grid slope partial x for all grid nodes where both lines overlap
+                dpth_valid = dpth[node_rows, node_cols]  # grid depth for all grid nodes where both lines overlap
+                xslope_valid = xslope[node_rows, node_cols]  # grid slope partial x for all grid nodes where both lines overlap
+                yslope_valid = yslope[node_rows, node_cols]  # grid slope partial y for all grid nodes where both lines overlap
+                lineone_valid = lineone[node_rows, node_cols]  # grid depth for line one for all grid nodes where both lines overlap
+                linetwo_valid = linetwo[node_rows, node_cols]  # grid depth for line two for all grid nodes where both lines overlap
 
                 # A-matrix is in order of roll, pitch, heading, x_translation, y_translation, horizontal scale factor
-                a_matrix = np.column_stack([yslope_valid * dpth_valid - y_node_valid,
-                                            -xslope_valid * dpth_valid,
-                                            xslope_valid * y_node_valid,
-                                            xslope_valid,
-                                            yslope_valid,
-                                            yslope_valid * y_node_valid])
+                # we build it column by column into one preallocated fortran ordered buffer, out= keeps the column
+                # expressions from allocating temporaries and fortran order hands BLAS contiguous columns
+                a_matrix = np.empty((dpth_valid.size, 6), order='F')
+                np.multiply(yslope_valid, dpth_valid, out=a_matrix[:, 0])
+                np.subtract(a_matrix[:, 0], y_node_valid, out=a_matrix[:, 0])
+                np.multiply(xslope_valid, dpth_valid, out=a_matrix[:, 1])
+                np.negative(a_matrix[:, 1], out=a_matrix[:, 1])
+                np.multiply(xslope_valid, y_node_valid, out=a_matrix[:, 2])
+                a_matrix[:, 3] = xslope_valid
+                a_matrix[:, 4] = yslope_valid
+                np.multiply(yslope_valid, y_node_valid, out=a_matrix[:, 5])
                 l_one_matrix = np.column_stack([lineone_valid, linetwo_valid])
                 # p_one can contain 1/grid node uncertainty in the future, currently we leave it out
                 # p_one_matrix = np.identity(self.a_matrix.shape[0])
-                # p_two_matrix = np.identity(6) * [1, 1, 1, 100000, 100000, 1]
-                p_two_matrix = np.identity(6) * [1 / self.initial_parameters['roll_unc'] ** 2, 1 / self.initial_parameters['pitch_unc'] ** 2,
-                                                 1 / self.initial_parameters['heading_unc'] ** 2, 1 / self.initial_parameters['x_unc'],
-                                                 1 / self.initial_parameters['y_unc'] ** 2, 1 / self.initial_parameters['hscale_unc']]
-                # print('weighted by {}'.format([1 / self.initial_parameters['roll_unc'] ** 2, 1 / self.initial_parameters['pitch_unc'] ** 2,
-                #                                1 / self.initial_parameters['heading_unc'] ** 2, 1 / self.initial_parameters['x_unc'],
-                #                                1 / self.initial_parameters['y_unc'] ** 2, 1 / self.initial_parameters['hscale_unc']]))
-                a_t = a_matrix.T
-                self.a_matrix = np.dot(a_t, a_matrix) + p_two_matrix
-                # self.a_matrix = np.dot(a_t, a_matrix)
-                self.b_matrix = np.dot(a_t, l_one_matrix)
+                # print('weighted by {}'.format(self._p_two_diag))
+                # A_transpose * A is symmetric, so only compute the upper triangle with the rank-k BLAS routine
+                # and mirror it, halving the flops of the full matrix product
+                ata = dsyrk(1.0, a_matrix, trans=1)
+                ata = ata + ata.T - np.diag(np.diag(ata))
+                # add the precomputed p_two weights straight to the diagonal, flat[::7] walks the 6x6 diagonal
+                ata.flat[::7] += self._p_two_diag
+                self.a_matrix = ata
+                self.b_matrix = np.einsum('ni,nk->ik', a_matrix, l_one_matrix, optimize=True)
             else:
                 print('No valid overlap found for lines: {}'.format(list(self.multibeam_files.keys())))
 
     def _compute_least_squares(self):
         if self.a_matrix is not None and self.b_matrix is not None:
             print('Computing least squares result')
-            self.lstsq_result, residuals, rank, singular = np.linalg.lstsq(self.a_matrix, self.b_matrix, rcond=None)
+            try:
+                # a_matrix is the normal equations matrix (A_transpose * A plus a positive diagonal weight), which
+                # is symmetric positive definite, so a Cholesky factorization solves the 6x6 system directly
+                # instead of the full SVD that np.linalg.lstsq runs
+                self.lstsq_result = cho_solve(cho_factor(self.a_matrix, lower=True, check_finite=False),
+                                              self.b_matrix, check_finite=False)
+            except np.linalg.LinAlgError:  # matrix was not positive definite, fall back to the least squares solver
+                self.lstsq_result, residuals, rank, singular = np.linalg.lstsq(self.a_matrix, self.b_matrix, rcond=None)
@@ -1,9 +1,23 @@
 import os
+import dask
+import dask.array as da
 import numpy as np
+import pandas as pd
 import xarray as xr
 from copy import deepcopy
 from datetime import datetime
 
+try:
+    import datashader
+    from datashader import transfer_functions as datashader_transfer
+except ImportError:  # datashader is optional, the soundings plot falls back to matplotlib scatter without it
+    datashader = None
+
+try:
+    import pyvista
+except ImportError:  # pyvista is optional, the 3d soundings plot falls back to matplotlib without it
+    pyvista = None
+
 import matplotlib.pyplot as plt
 from matplotlib.pyplot import get_current_fig_manager
 from matplotlib.animation import FuncAnimation, FFMpegWriter
@@ -14,7 +28,16 @@ import matplotlib.widgets
 
 from mpl_toolkits.mplot3d import Axes3D  # need this, is used in backend for 3d plots
 
-from HSTB.kluster.xarray_helpers import stack_nan_array
+
+# soundings_plot_2d switches from matplotlib scatter to datashader rasterization above this point count, scatter
+#   redraw cost grows with the sounding count while the rasterized image is a fixed cost per redraw
+datashader_point_threshold = 50000
+# without datashader, large depth-colored clouds are drawn as one solid-color scatter per depth bucket, matplotlib
+#   draws monochrome collections much faster than per-point colormapped ones
+scatter_color_buckets = 16
+# soundings_plot_3d hands clouds above this size to pyvista when it is installed, mplot3d re-sorts every point on
+#   the cpu for each rotation and becomes unusable well before this count
+pyvista_point_threshold = 200000
 
 
 class Player(FuncAnimation):
@@ -283,18 +306,28 @@ class FqprVisualizations:
         self.orientation_figure = None
         self.orientation_objects = None
         self.orientation_anim = None
+        self.orientation_frames = None
+        self._orientation_vectors = None
+        self._orientation_tx_text = None
+        self._orientation_rx_text = None
 
         self.raw_bpv_quiver = None
         self.raw_bpv_dat = None
         self.raw_bpv_figure = None
         self.raw_bpv_objects = None
         self.raw_bpv_anim = None
+        self._raw_bpv_stats = None
 
         self.proc_bpv_quiver = None
         self.proc_bpv_dat = None
         self.proc_bpv_figure = None
         self.proc_bpv_objects = None
         self.proc_bpv_anim = None
+        self._proc_bpv_stats = None
+
+        # (system index, variable name) entries already persisted into memory for the animations, so repeat
+        #   visualizations do not re-execute the same dask graph
+        self._persisted_vars = set()
 
     def _parse_plot_mode(self, mode: str):
         """
@@ -329,6 +362,63 @@ class FqprVisualizations:
             raise ValueError('{}: Unable to find one or more variables in the raw_ping records'.format(mode))
         return xvar, yvar, zvar
 
+    def _stack_soundings(self, xvar: str, yvar: str, zvar: str, include_sector: bool = False, downcast: bool = False):
+        """
+        Build flattened x/y/z arrays across all systems for the soundings plots.  The three variables share one valid
+        mask, computed once per system, instead of each variable dropping its own NaNs in a separate pass.  The plots
+        then make a single scatter/raster call with the concatenated result.
+
+        Parameters
+        ----------
+        xvar
+            variable name for the x dimension
+        yvar
+            variable name for the y dimension
+        zvar
+            variable name for the z dimension
+        include_sector
+            if True, also return the txsector_beam values for the valid soundings
+        downcast
+            if True, downcast the returned arrays to float32.  Safe for the svcorr offsets, georeferenced
+            eastings/northings keep float64 for the sub-meter precision
+
+        Returns
+        -------
+        np.ndarray
+            1d array of the valid xvar values across all systems
+        np.ndarray
+            1d array of the valid yvar values across all systems
+        np.ndarray
+            1d array of the valid zvar values across all systems
+        np.ndarray
+            1d array of the txsector_beam values for the valid soundings, None if include_sector is False
+        """
+
+        xs, ys, zs, sectors = [], [], [], []
+        for rp in self.fqpr.multibeam.raw_ping:
+            # .data instead of .values keeps dask-backed variables lazy, one task graph is built across all
+            #   systems and evaluated in a single scheduler pass at the end
+            x = rp[xvar].data.ravel()
+            y = rp[yvar].data.ravel()
+            z = rp[zvar].data.ravel()
+            valid = ~(np.isnan(x) | np.isnan(y) | np.isnan(z))
+            xs.append(x[valid])
+            ys.append(y[valid])
+            zs.append(z[valid])
+            if include_sector:
+                sectors.append(rp.txsector_beam.data.ravel()[valid])
+        x = np.concatenate(xs)
+        y = np.concatenate(ys)
+        z = np.concatenate(zs)
+        sector = np.concatenate(sectors) if include_sector else None
+        if downcast:  # halves the memory traffic through the mask/draw pipeline
+            x = x.astype(np.float32, copy=False)
+            y = y.astype(np.float32, copy=False)
+            z = z.astype(np.float32, copy=False)
+        if isinstance(x, da.Array):
+            x, y, z, sector = dask.compute(x, y, z, sector)
+        return x, y, z, sector
+
     def soundings_plot_3d(self, mode: str = 'svcorr', color_by: str = 'depth', start_time: float = None, end_time: float = None):
         """
         Plots a 3d representation of the alongtrack/acrosstrack/depth values generated by sv correct.
@@ -348,7 +438,7 @@ class FqprVisualizations:
         Returns
         -------
         plt.Axes
-            matplotlib axes object for plot
+            matplotlib axes object for plot, or the pyvista Plotter if the cloud was large enough to route to pyvista
         """
 
         if start_time is not None or start_time is not None:
@@ -356,6 +446,22 @@ class FqprVisualizations:
 
         xvar, yvar, zvar = self._parse_plot_mode(mode)
 
+        if pyvista is not None:
+            total_points = int(sum(rp[zvar].size for rp in self.fqpr.multibeam.raw_ping))
+            if total_points > pyvista_point_threshold:
+                # mplot3d z-sorts every point on the cpu for each view change, pyvista uploads the cloud to the
+                #   gpu once and stays interactive at millions of soundings
+                x, y, z, sector = self._stack_soundings(xvar, yvar, zvar, include_sector=(color_by == 'sector'),
+                                                        downcast=(mode == 'svcorr'))
+                cloud = pyvista.PolyData(np.column_stack([x, y, -z.astype(x.dtype)]))
+                plotter = pyvista.Plotter()
+                plotter.add_points(cloud, scalars=(z if color_by == 'depth' else sector), cmap='coolwarm',
+                                   point_size=3)
+                plotter.show()
+                if start_time is not None or start_time is not None:
+                    self.fqpr.restore_subset()
+                return plotter
+
         minz = self.fqpr.calc_min_var(zvar)
         maxz = self.fqpr.calc_max_var(zvar)
         miny = self.fqpr.calc_min_var(yvar)
@@ -370,16 +476,12 @@ class FqprVisualizations:
         fig = plt.figure()
         ax = fig.add_subplot(111, projection='3d')
 
-        for rp in self.fqpr.multibeam.raw_ping:
-            x_idx, x_stck = stack_nan_array(rp[xvar], stack_dims=('time', 'beam'))
-            y_idx, y_stck = stack_nan_array(rp[yvar], stack_dims=('time', 'beam'))
-            z_idx, z_stck = stack_nan_array(rp[zvar], stack_dims=('time', 'beam'))
-
-            if color_by == 'depth':
-                ax.scatter(x_stck.values, y_stck.values, z_stck.values, marker='o', s=10, c=z_stck.values)
-            elif color_by == 'sector':
-                sector_vals = rp.txsector_beam.values[x_idx]
-                ax.scatter(x_stck.values, y_stck.values, z_stck.values, marker='o', s=10, c=sector_vals)
+        x, y, z, sector = self._stack_soundings(xvar, yvar, zvar, include_sector=(color_by == 'sector'),
+                                                downcast=(mode == 'svcorr'))
+        if color_by == 'depth':
+            ax.scatter(x, y, z, marker='o', s=10, c=z)
+        elif color_by == 'sector':
+            ax.scatter(x, y, z, marker='o', s=10, c=sector)
 
         ax.set_xlim(minx, maxx)
         ax.set_ylim(miny, maxy)
@@ -429,20 +531,40 @@ class FqprVisualizations:
 
         fig = plt.figure()
 
-        for rp in self.fqpr.multibeam.raw_ping:
-            x_idx, x_stck = stack_nan_array(rp[xvar], stack_dims=('time', 'beam'))
-            y_idx, y_stck = stack_nan_array(rp[yvar], stack_dims=('time', 'beam'))
-            z_idx, z_stck = stack_nan_array(rp[zvar], stack_dims=('time', 'beam'))
-
+        used_datashader = False
+        if datashader is not None and color_by == 'depth':
+            total_points = int(sum(rp[zvar].size for rp in self.fqpr.multibeam.raw_ping))
+            if total_points > datashader_point_threshold:
+                self._datashade_soundings(xvar, yvar, zvar, (miny, maxy), (minx, maxx), (minz, maxz))
+                used_datashader = True
+        drew_own_colorbar = used_datashader  # the datashader/bucketed paths draw an explicit colorbar
+        if not used_datashader:
+            x, y, z, sector = self._stack_soundings(xvar, yvar, zvar, include_sector=(color_by == 'sector'),
+                                                    downcast=(mode == 'svcorr'))
             if color_by == 'depth':
-                plt.scatter(y_stck, x_stck, marker='+', c=z_stck, cmap='coolwarm', s=5)
-                plt.clim(minz, maxz)
+                if x.size > datashader_point_threshold:
+                    # quantize depth into a few solid-color scatters, the monochrome draw path inside matplotlib
+                    #   avoids the per-point color mapping on every redraw
+                    cmap = plt.get_cmap('coolwarm')
+                    bucket_edges = np.linspace(minz, maxz, scatter_color_buckets + 1)
+                    bucket = np.clip(np.digitize(z, bucket_edges) - 1, 0, scatter_color_buckets - 1)
+                    for bucket_index in np.unique(bucket):
+                        bidx = bucket == bucket_index
+                        # Line2D with pixel markers draws through a much faster renderer path than a scatter
+                        #   PathCollection, and at this point count individual marker shapes are not visible anyway
+                        plt.plot(y[bidx], x[bidx], marker=',', linestyle='None',
+                                 color=cmap((bucket_index + 0.5) / scatter_color_buckets))
+                    mappable = cm.ScalarMappable(norm=plt.Normalize(minz, maxz), cmap='coolwarm')
+                    plt.colorbar(mappable, ax=plt.gca()).set_label(zvar, rotation=270, labelpad=10)
+                    drew_own_colorbar = True
+                else:
+                    plt.scatter(y, x, marker='+', c=z, cmap='coolwarm', s=5)
+                    plt.clim(minz, maxz)
             elif color_by == 'sector':
-                sector_vals = rp.txsector_beam.values[x_idx]
-                plt.scatter(y_stck, x_stck, marker='+', c=sector_vals, s=5)
+                plt.scatter(y, x, marker='+', c=sector, s=5)
         plt.xlim(miny, maxy)
         plt.ylim(minx, maxx)
-        if color_by != 'sector':
+        if color_by != 'sector' and not drew_own_colorbar:
             plt.colorbar().set_label(zvar, rotation=270, labelpad=10)
         plt.title('{}: {}/{} colored by {}'.format(mode, xvar, yvar, color_by))
 
@@ -451,6 +573,38 @@ class FqprVisualizations:
 
         return fig
 
+    def _datashade_soundings(self, xvar: str, yvar: str, zvar: str, plot_xlim: tuple, plot_ylim: tuple, clim: tuple):
+        """
+        Rasterize the soundings to a fixed resolution image with datashader and draw that image instead of a scatter.
+        Scatter redraw cost scales with the sounding count, the rasterized image costs the same regardless of how many
+        soundings there are, so we use this path for large point counts when datashader is installed.
+
+        Parameters
+        ----------
+        xvar
+            variable name for the x dimension
+        yvar
+            variable name for the y dimension
+        zvar
+            variable name for the z dimension, used for the aggregated color value
+        plot_xlim
+            (min, max) of the plot x axis (the yvar values)
+        plot_ylim
+            (min, max) of the plot y axis (the xvar values)
+        clim
+            (min, max) of the zvar values, used for the color scale
+        """
+
+        x, y, z, _ = self._stack_soundings(xvar, yvar, zvar)
+        df = pd.DataFrame({'x': x, 'y': y, 'z': z})
+        canvas = datashader.Canvas(plot_width=800, plot_height=600, x_range=plot_xlim, y_range=plot_ylim)
+        agg = canvas.points(df, 'y', 'x', datashader.mean('z'))
+        img = datashader_transfer.shade(agg, cmap=cm.coolwarm, span=clim, how='linear')
+        plt.imshow(np.asarray(img.to_pil()), extent=(plot_xlim[0], plot_xlim[1], plot_ylim[0], plot_ylim[1]),
+                   aspect='auto')
+        mappable = cm.ScalarMappable(norm=plt.Normalize(clim[0], clim[1]), cmap='coolwarm')
+        plt.colorbar(mappable, ax=plt.gca()).set_label(zvar, rotation=270, labelpad=10)
+
     def plot_sound_velocity_profiles(self, filter_by_time: bool = False):
         """
         Get all the sound velocity profiles attached to this fqpr instance and plot the values by depth/sv.  If the
@@ -630,19 +784,20 @@ class FqprVisualizations:
             float, time at this specific interval
         """
 
-        vecdata = self._generate_orientation_vector(self.orientation_system, time)
-        tx_x = round(vecdata[3][0], 3)
-        tx_y = round(vecdata[4][0], 3)
-        tx_z = round(vecdata[5][0], 3)
-        rx_x = round(vecdata[3][1], 3)
-        rx_y = round(vecdata[4][1], 3)
-        rx_z = round(vecdata[5][1], 3)
+        # the per-frame vectors and label strings are precomputed in visualize_orientation_vector, the callback
+        #   just maps the frame time to its index and draws
+        frame_index = min(int(np.searchsorted(self.orientation_frames, time)), len(self.orientation_frames) - 1)
+        tx = self._orientation_vectors[0][frame_index]
+        rx = self._orientation_vectors[1][frame_index]
+        origin = [0, 0, 0]
+        x, y, z = zip(origin, origin)
+        u, v, w = zip(tx, rx)
 
         self.orientation_quiver.remove()
-        self.orientation_quiver = self.orientation_figure.quiver(*vecdata, color=['blue', 'red'])
+        self.orientation_quiver = self.orientation_figure.quiver(x, y, z, u, v, w, color=['blue', 'red'])
         # self.orientation_objects['time'].set_text('Time: {:0.3f}'.format(time))
-        self.orientation_objects['tx_vec'].set_text('TX Vector: x:{:0.3f}, y:{:0.3f}, z:{:0.3f}'.format(tx_x, tx_y, tx_z))
-        self.orientation_objects['rx_vec'].set_text('RX Vector: x:{:0.3f}, y:{:0.3f}, z:{:0.3f}'.format(rx_x, rx_y, rx_z))
+        self.orientation_objects['tx_vec'].set_text(self._orientation_tx_text[frame_index])
+        self.orientation_objects['rx_vec'].set_text(self._orientation_rx_text[frame_index])
 
     def visualize_orientation_vector(self, system_index: int = 0):
         """
@@ -664,8 +819,12 @@ class FqprVisualizations:
 
         self.orientation_objects = {}
 
-        self.fqpr.multibeam.raw_ping[system_index]['tx'] = self.fqpr.multibeam.raw_ping[system_index]['tx'].compute()
-        self.fqpr.multibeam.raw_ping[system_index]['rx'] = self.fqpr.multibeam.raw_ping[system_index]['rx'].compute()
+        for rec in search_for_these:
+            # persist rather than compute, keeps the data distributed when a dask cluster is attached.  Persisted
+            #   once per system/variable, the per-frame update then selects from the in-memory array
+            if (system_index, rec) not in self._persisted_vars:
+                self.fqpr.multibeam.raw_ping[system_index][rec] = self.fqpr.multibeam.raw_ping[system_index][rec].persist()
+                self._persisted_vars.add((system_index, rec))
 
         fig = plt.figure('Transducer Orientation Vectors', figsize=(10, 8))
         self.orientation_figure = fig.add_subplot(111, projection='3d')
@@ -686,11 +845,67 @@ class FqprVisualizations:
 
         outfold = self.fqpr.multibeam.converted_pth  # parent folder to all the currently written data
         frames = self.fqpr.multibeam.raw_ping[system_index].time.values
+        self.orientation_frames = frames
+        # average the beam vectors and format the frame labels for every frame in one pass up front, the animation
+        #   callback then only indexes these
+        tx_mean = np.nanmean(self.fqpr.multibeam.raw_ping[system_index].tx.values, axis=1)
+        rx_mean = np.nanmean(self.fqpr.multibeam.raw_ping[system_index].rx.values, axis=1)
+        self._orientation_vectors = (tx_mean, rx_mean)
+        self._orientation_tx_text = ['TX Vector: x:{:0.3f}, y:{:0.3f}, z:{:0.3f}'.format(*row) for row in tx_mean.round(3)]
+        self._orientation_rx_text = ['RX Vector: x:{:0.3f}, y:{:0.3f}, z:{:0.3f}'.format(*row) for row in rx_mean.round(3)]
         self.orientation_anim = Player(fig, self._update_orientation_vector, frames=frames,
                                        save_count=len(frames), save_pth=os.path.join(outfold, 'vessel_orientation.mpeg'),
                                        pos=(0.125, 0.02))
         self.orientation_anim.bind_to(self._orientation_cleanup)
 
+    def _precompute_bpv_components(self, dat: xr.Dataset, angle_variable: str):
+        """
+        Compute the acrosstrack/downward vector components for every ping in one vectorized pass, stored as new
+        variables on the dataset.  The per-frame update then just selects and normalizes the precomputed components
+        rather than re-running the trig on every frame of the animation.
+
+        Parameters
+        ----------
+        dat
+            dataset containing the angle/traveltimes to plot
+        angle_variable
+            name of the angle variable, one of 'corr_pointing_angle', 'beampointingangle'
+        """
+
+        # float32 halves the memory held for the life of the animation, plenty of precision for a scaled display
+        dat['bpv_u'] = (np.sin(dat[angle_variable]) * dat['traveltime']).astype(np.float32)
+        dat['bpv_v'] = (np.cos(dat[angle_variable]) * dat['traveltime']).astype(np.float32)
+
+    def _precompute_bpv_frame_labels(self, dat: xr.Dataset, angle_variable: str):
+        """
+        Compute the outermost port/starboard angle (in degrees) and traveltime for every ping in one vectorized
+        pass.  These drive the text labels in the beam vector animations, the per-frame update callbacks then only
+        index into these arrays instead of masking and converting a ping slice every frame.
+
+        Parameters
+        ----------
+        dat
+            dataset containing the angle/traveltimes to plot
+        angle_variable
+            name of the angle variable, one of 'corr_pointing_angle', 'beampointingangle'
+
+        Returns
+        -------
+        dict
+            per-ping label value arrays, keys 'outer_angle', 'outer_traveltime', 'inner_angle', 'inner_traveltime'
+        """
+
+        angles = dat[angle_variable].values
+        traveltime = dat['traveltime'].values
+        valid = ~(np.isnan(angles) | np.isnan(traveltime))
+        first_beam = valid.argmax(axis=1)
+        last_beam = valid.shape[1] - 1 - valid[:, ::-1].argmax(axis=1)
+        rows = np.arange(angles.shape[0])
+        return {'outer_angle': np.rad2deg(angles[rows, first_beam]),
+                'outer_traveltime': traveltime[rows, first_beam],
+                'inner_angle': np.rad2deg(angles[rows, last_beam]),
+                'inner_traveltime': traveltime[rows, last_beam]}
+
     def _generate_bpv_arrs(self, dat: xr.Dataset):
         """
         Generate traveltime/beampointingangle vectors to be used with matplotlib quiver
@@ -712,21 +927,26 @@ class FqprVisualizations:
             y direction component of vectors
         """
 
-        try:  # uncorrected version
-            bpa = dat.beampointingangle.values.ravel()
-        except:
-            bpa = dat.corr_pointing_angle.values.ravel()
-        tt = dat.traveltime.values.ravel()
+        if 'bpv_u' in dat:  # components were precomputed in one vectorized pass at visualization setup
+            u = dat.bpv_u.values.ravel()
+            v = dat.bpv_v.values.ravel()
+            valid_idx = ~(np.isnan(u) | np.isnan(v))
+            u = u[valid_idx]
+            v = v[valid_idx]
+        else:
+            try:  # uncorrected version
+                bpa = dat.beampointingangle.values.ravel()
+            except:
+                bpa = dat.corr_pointing_angle.values.ravel()
+            tt = dat.traveltime.values.ravel()
 
-        valid_bpa = ~np.isnan(bpa)
-        valid_tt = ~np.isnan(tt)
-        valid_idx = np.logical_and(valid_bpa, valid_tt)
-        bpa = bpa[valid_idx]
-        tt = tt[valid_idx]
+            valid_idx = ~(np.isnan(bpa) | np.isnan(tt))
+            bpa = bpa[valid_idx]
+            tt = tt[valid_idx]
+            u = np.sin(bpa) * tt
+            v = np.cos(bpa) * tt
 
-        maxbeams = bpa.shape[0]
-        u = np.sin(bpa) * tt
-        v = np.cos(bpa) * tt
+        maxbeams = u.shape[0]
         u = -u / np.max(u)  # negative here for beam pointing angle so the port angles (pos) are on the left side
         v = -v / np.max(v)  # negative here for travel time so the vectors point down in the graph
 
@@ -746,50 +966,34 @@ class FqprVisualizations:
             ping time value
         """
 
-        subset = self.proc_bpv_dat.sel(time=time_val)
-        angles = subset.corr_pointing_angle.values
-        traveltime = subset.traveltime.values
-        valid_bpa = ~np.isnan(angles)
-        valid_tt = ~np.isnan(traveltime)
-        valid_idx = np.logical_and(valid_bpa, valid_tt)
-        angles = angles[valid_idx]
-        traveltime = traveltime[valid_idx]
-
-        if self.proc_bpv_quiver is not None:
-            self.proc_bpv_quiver.remove()
-        if self.fqpr.multibeam.is_dual_head():
-            newidx = np.where(self.proc_bpv_dat.time == time_val)[0] + 1
-            try:
-                subset_next = self.proc_bpv_dat.isel(time=newidx)
-                nextangles = subset_next.corr_pointing_angle.values
-                nexttraveltime = subset_next.traveltime.values
-                nextvalid_bpa = ~np.isnan(nextangles)
-                nextvalid_tt = ~np.isnan(nexttraveltime)
-                nextvalid_idx = np.logical_and(nextvalid_bpa, nextvalid_tt)
-                nextangles = nextangles[nextvalid_idx]
-                nexttraveltime = nexttraveltime[nextvalid_idx]
-
-                pouterang = [str(round(np.rad2deg(angles[0]), 3)), str(round(np.rad2deg(nextangles[0]), 3))]
-                poutertt = [str(round(traveltime[0], 3)), str(round(nexttraveltime[0], 3))]
-                pinnerang = [str(round(np.rad2deg(angles[-1]), 3)), str(round(np.rad2deg(nextangles[-1]), 3))]
-                pinnertt = [str(round(traveltime[-1], 3)), str(round(nexttraveltime[-1], 3))]
-                idx = [time_val, float(subset_next.time.values)]
-            except IndexError:  # EOF
-                pouterang = str(round(np.rad2deg(angles[0]), 3))
-                poutertt = str(round(traveltime[0], 3))
-                pinnerang = str(round(np.rad2deg(angles[-1]), 3))
-                pinnertt = str(round(traveltime[-1], 3))
-                idx = time_val
+        # label values were precomputed for all pings at setup, just map the frame time to its index
+        stats = self._proc_bpv_stats
+        tindex = int(np.searchsorted(self.proc_bpv_dat.time.values, time_val))
+        if self.fqpr.multibeam.is_dual_head() and tindex + 1 < stats['outer_angle'].shape[0]:
+            nindex = tindex + 1
+            pouterang = '[{:.3f}, {:.3f}]'.format(stats['outer_angle'][tindex], stats['outer_angle'][nindex])
+            poutertt = '[{:.3f}, {:.3f}]'.format(stats['outer_traveltime'][tindex], stats['outer_traveltime'][nindex])
+            pinnerang = '[{:.3f}, {:.3f}]'.format(stats['inner_angle'][tindex], stats['inner_angle'][nindex])
+            pinnertt = '[{:.3f}, {:.3f}]'.format(stats['inner_traveltime'][tindex], stats['inner_traveltime'][nindex])
+            idx = [time_val, float(self.proc_bpv_dat.time.values[nindex])]
         else:
-            pouterang = str(round(np.rad2deg(angles[0]), 3))
-            poutertt = str(round(traveltime[0], 3))
-            pinnerang = str(round(np.rad2deg(angles[-1]), 3))
-            pinnertt = str(round(traveltime[-1], 3))
+            pouterang = '{:.3f}'.format(stats['outer_angle'][tindex])
+            poutertt = '{:.3f}'.format(stats['outer_traveltime'][tindex])
+            pinnerang = '{:.3f}'.format(stats['inner_angle'][tindex])
+            pinnertt = '{:.3f}'.format(stats['inner_traveltime'][tindex])
             idx = time_val
 
-        self.proc_bpv_quiver = self.proc_bpv_figure.quiver(*self._generate_bpv_arrs(self.proc_bpv_dat.sel(time=idx)),
-                                                           color=self._generate_bpv_colors(self.proc_bpv_dat.sel(time=idx)),
-                                                           units='xy', scale=1)
+        arrs = self._generate_bpv_arrs(self.proc_bpv_dat.sel(time=idx))
+        colors = self._generate_bpv_colors(self.proc_bpv_dat.sel(time=idx))
+        if self.proc_bpv_quiver is not None and self.proc_bpv_quiver.N == len(arrs[2]):
+            # same arrow count as the previous frame, update the existing quiver buffers in place instead of
+            #   tearing down and rebuilding the whole collection
+            self.proc_bpv_quiver.set_UVC(arrs[2], arrs[3])
+            self.proc_bpv_quiver.set_color(colors)
+        else:
+            if self.proc_bpv_quiver is not None:
+                self.proc_bpv_quiver.remove()
+            self.proc_bpv_quiver = self.proc_bpv_figure.quiver(*arrs, color=colors, units='xy', scale=1)
         # self.proc_bpv_objects['Time'].set_text('Time: {}'.format(idx))
 
         self.proc_bpv_objects['Port_outer_angle'].set_text('Port outermost angle: {}°'.format(pouterang))
@@ -809,50 +1013,34 @@ class FqprVisualizations:
             ping time value
         """
 
-        subset = self.raw_bpv_dat.sel(time=time_val)
-        angles = subset.beampointingangle.values
-        traveltime = subset.traveltime.values
-        valid_bpa = ~np.isnan(angles)
-        valid_tt = ~np.isnan(traveltime)
-        valid_idx = np.logical_and(valid_bpa, valid_tt)
-        angles = angles[valid_idx]
-        traveltime = traveltime[valid_idx]
-
-        if self.raw_bpv_quiver is not None:
-            self.raw_bpv_quiver.remove()
-        if self.fqpr.multibeam.is_dual_head():
-            newidx = np.where(self.proc_bpv_dat.time == time_val)[0] + 1
-            try:
-                subset_next = self.raw_bpv_dat.isel(time=newidx + 1)
-                nextangles = subset_next.beampointingangle.values
-                nexttraveltime = subset_next.traveltime.values
-                nextvalid_bpa = ~np.isnan(nextangles)
-                nextvalid_tt = ~np.isnan(nexttraveltime)
-                nextvalid_idx = np.logical_and(nextvalid_bpa, nextvalid_tt)
-                nextangles = nextangles[nextvalid_idx]
-                nexttraveltime = nexttraveltime[nextvalid_idx]
-
-                pouterang = [str(round(np.rad2deg(angles[0]), 3)), str(round(np.rad2deg(nextangles[0]), 3))]
-                poutertt = [str(round(traveltime[0], 3)), str(round(nexttraveltime[0], 3))]
-                pinnerang = [str(round(np.rad2deg(angles[-1]), 3)), str(round(np.rad2deg(nextangles[-1]), 3))]
-                pinnertt = [str(round(traveltime[-1], 3)), str(round(nexttraveltime[-1], 3))]
-                idx = [time_val, float(subset_next.time.values)]
-            except IndexError:  # EOF
-                pouterang = str(round(np.rad2deg(angles[0]), 3))
-                poutertt = str(round(traveltime[0], 3))
-                pinnerang = str(round(np.rad2deg(angles[-1]), 3))
-                pinnertt = str(round(traveltime[-1], 3))
-                idx = time_val
+        # label values were precomputed for all pings at setup, just map the frame time to its index
+        stats = self._raw_bpv_stats
+        tindex = int(np.searchsorted(self.raw_bpv_dat.time.values, time_val))
+        if self.fqpr.multibeam.is_dual_head() and tindex + 1 < stats['outer_angle'].shape[0]:
+            nindex = tindex + 1
+            pouterang = '[{:.3f}, {:.3f}]'.format(stats['outer_angle'][tindex], stats['outer_angle'][nindex])
+            poutertt = '[{:.3f}, {:.3f}]'.format(stats['outer_traveltime'][tindex], stats['outer_traveltime'][nindex])
+            pinnerang = '[{:.3f}, {:.3f}]'.format(stats['inner_angle'][tindex], stats['inner_angle'][nindex])
+            pinnertt = '[{:.3f}, {:.3f}]'.format(stats['inner_traveltime'][tindex], stats['inner_traveltime'][nindex])
+            idx = [time_val, float(self.raw_bpv_dat.time.values[nindex])]
         else:
-            pouterang = str(round(np.rad2deg(angles[0]), 3))
-            poutertt = str(round(traveltime[0], 3))
-            pinnerang = str(round(np.rad2deg(angles[-1]), 3))
-            pinnertt = str(round(traveltime[-1], 3))
+            pouterang = '{:.3f}'.format(stats['outer_angle'][tindex])
+            poutertt = '{:.3f}'.format(stats['outer_traveltime'][tindex])
+            pinnerang = '{:.3f}'.format(stats['inner_angle'][tindex])
+            pinnertt = '{:.3f}'.format(stats['inner_traveltime'][tindex])
             idx = time_val
 
-        self.raw_bpv_quiver = self.raw_bpv_figure.quiver(*self._generate_bpv_arrs(self.raw_bpv_dat.sel(time=idx)),
-                                                         color=self._generate_bpv_colors(self.raw_bpv_dat.sel(time=idx)),
-                                                         units='xy', scale=1)
+        arrs = self._generate_bpv_arrs(self.raw_bpv_dat.sel(time=idx))
+        colors = self._generate_bpv_colors(self.raw_bpv_dat.sel(time=idx))
+        if self.raw_bpv_quiver is not None and self.raw_bpv_quiver.N == len(arrs[2]):
+            # same arrow count as the previous frame, update the existing quiver buffers in place instead of
+            #   tearing down and rebuilding the whole collection
+            self.raw_bpv_quiver.set_UVC(arrs[2], arrs[3])
+            self.raw_bpv_quiver.set_color(colors)
+        else:
+            if self.raw_bpv_quiver is not None:
+                self.raw_bpv_quiver.remove()
+            self.raw_bpv_quiver = self.raw_bpv_figure.quiver(*arrs, color=colors, units='xy', scale=1)
         # self.raw_bpv_objects['Time'].set_text('Time: {}'.format(idx))
 
         self.raw_bpv_objects['Port_outer_angle'].set_text('Port outermost angle: {}°'.format(pouterang))
@@ -886,7 +1074,6 @@ class FqprVisualizations:
                 subsetdat = dat.isel(time=i)
             else:
                 subsetdat = dat
-            systemident = subsetdat.system_identifier.values
             sector_numbers = subsetdat.txsector_beam.values.ravel()
             if max_sector is None:
                 max_sector = np.max(sector_numbers)
@@ -896,12 +1083,11 @@ class FqprVisualizations:
             sec_numbers.append(sector_numbers)
 
         sec_numbers = np.concatenate(sec_numbers)
+        # map the raw sector numbers to contiguous indices in one pass, spreads the colormap evenly across the
+        #   sectors actually present regardless of the raw numbering
+        unique_sectors, inverse_idx = np.unique(sec_numbers, return_inverse=True)
         colormap = cm.rainbow
-        if np.max(sec_numbers) > 0:
-            # scale for the max integer count of sectors
-            return colormap(sec_numbers / np.max(sec_numbers))
-        else:
-            return colormap(sec_numbers)
+        return colormap(inverse_idx / max(inverse_idx.max(), 1))
 
     def visualize_beam_pointing_vectors(self, corrected: bool = False):
         """
@@ -944,6 +1130,8 @@ class FqprVisualizations:
             obj['Starboard_outer_traveltime'] = self.proc_bpv_figure.text(0.35, 0.35, '')
 
             self.proc_bpv_dat = self.fqpr.subset_variables(['corr_pointing_angle', 'traveltime', 'txsector_beam'], skip_subset_by_time=True)
+            self._precompute_bpv_components(self.proc_bpv_dat, 'corr_pointing_angle')
+            self._proc_bpv_stats = self._precompute_bpv_frame_labels(self.proc_bpv_dat, 'corr_pointing_angle')
             dat = self.proc_bpv_dat
         else:
             fg = plt.figure('Raw Beam Vectors', figsize=(10, 8))
@@ -966,6 +1154,8 @@ class FqprVisualizations:
 
             self.raw_bpv_dat = self.fqpr.subset_variables(['beampointingangle', 'traveltime', 'txsector_beam'], skip_subset_by_time=True)
             self.raw_bpv_dat['beampointingangle'] = np.deg2rad(self.raw_bpv_dat['beampointingangle'])
+            self._precompute_bpv_components(self.raw_bpv_dat, 'beampointingangle')
+            self._raw_bpv_stats = self._precompute_bpv_frame_labels(self.raw_bpv_dat, 'beampointingangle')
             dat = self.raw_bpv_dat
 
         if self.fqpr.multibeam.is_dual_head():  # for dual head, we end up plotting two records each time
@@ -992,6 +1182,10 @@ class FqprVisualizations:
         self.orientation_figure = None
         self.orientation_objects = None
         self.orientation_anim = None
+        self.orientation_frames = None
+        self._orientation_vectors = None
+        self._orientation_tx_text = None
+        self._orientation_rx_text = None
 
     def _uncorr_cleanup(self):
         """
@@ -1002,6 +1196,7 @@ class FqprVisualizations:
         self.raw_bpv_figure = None
         self.raw_bpv_objects = None
         self.raw_bpv_anim = None
+        self._raw_bpv_stats = None
 
     def _corr_cleanup(self):
         """
@@ -1012,6 +1207,7 @@ class FqprVisualizations:
         self.proc_bpv_figure = None
         self.proc_bpv_objects = None
         self.proc_bpv_anim = None
+        self._proc_bpv_stats = None
 
     def plot_tvu_sample(self):
         """
@@ -2,7 +2,6 @@ from watchdog.observers import Observer
 from watchdog.events import PatternMatchingEventHandler, FileCreatedEvent, FileDeletedEvent
 from threading import Thread, Event
 from types import FunctionType
-import numpy as np
 import os
 from HSTB.kluster import kluster_variables
 
@@ -11,7 +10,7 @@ supported_mbes = kluster_variables.supported_multibeam
 supported_sbet = kluster_variables.supported_ppnav  # people keep mixing up these extensions, so just check for the nav/smrmsg in both
 supported_export_log = kluster_variables.supported_ppnav_log
 supported_svp = kluster_variables.supported_sv
-all_extensions = list(np.concatenate([supported_mbes, supported_sbet, supported_export_log, supported_svp]))
+all_extensions = frozenset(supported_mbes + supported_sbet + supported_export_log + supported_svp)
 
 
 class DirectoryMonitor:
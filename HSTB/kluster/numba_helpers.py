@@ -153,6 +153,63 @@ def is_inside_sm(polygon, point):
     return intersections & 1
 
 
+@numba.njit(parallel=True)
+def both_valid_mask(lyrone: np.ndarray, lyrtwo: np.ndarray):
+    """
+    Return a boolean mask of the cells where both 2d layers hold real (non-nan) values.  The equivalent
+    np.logical_and(~np.isnan(lyrone), ~np.isnan(lyrtwo)) makes five passes over the layers with four temporary
+    arrays, this fuses the nan checks (a nan never equals itself) into a single parallel pass.
+
+    Parameters
+    ----------
+    lyrone
+        numpy ndarray, first 2d layer
+    lyrtwo
+        numpy ndarray, second 2d layer, same shape as the first
+
+    Returns
+    -------
+    np.ndarray
+        2d boolean mask, True where both layers have a real value
+    """
+
+    valid = np.empty(lyrone.shape, dtype=numba.boolean)
+    for i in numba.prange(lyrone.shape[0]):
+        for j in range(lyrone.shape[1]):
+            valid[i, j] = (lyrone[i, j] == lyrone[i, j]) and (lyrtwo[i, j] == lyrtwo[i, j])
+    return valid
+
+
+@numba.njit(parallel=True, fastmath=True)
+def rotate_points_inplace(x: np.ndarray, y: np.ndarray, min_x: float, min_y: float, cos_az: float, sin_az: float):
+    """
+    Rotate the provided x/y points about the (min_x, min_y) origin, overwriting the input arrays.  The subtraction
+    and the two rotation equations are fused into a single pass per element, run in parallel across cores, so each
+    point is only loaded/stored once regardless of array size.
+
+    Parameters
+    ----------
+    x
+        numpy array, 1d easting values, overwritten with the rotated values
+    y
+        numpy array, 1d northing values, overwritten with the rotated values
+    min_x
+        x coordinate of the center of rotation
+    min_y
+        y coordinate of the center of rotation
+    cos_az
+        cosine of the rotation angle
+    sin_az
+        sine of the rotation angle
+    """
+
+    for i in numba.prange(x.size):
+        origin_x = x[i] - min_x
+        origin_y = y[i] - min_y
+        x[i] = min_x + cos_az * origin_x - sin_az * origin_y
+        y[i] = min_y + sin_az * origin_x + cos_az * origin_y
+
+
 @numba.njit(parallel=True)
 def is_inside_sm_parallel(points, polygon):
     ln = len(points)
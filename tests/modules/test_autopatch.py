@@ -0,0 +1,30 @@
+import numpy as np
+import unittest
+
+from HSTB.kluster.modules.autopatch import PatchTest
+
+
+class TestPatchTest(unittest.TestCase):
+
+    def test_return_mean_adjustments(self):
+        # one column per line, rows in order of roll, pitch, heading, x translation, y translation, hscale factor
+        lstsq_result = np.array([[0.1, 0.3],
+                                 [1.1, 1.3],
+                                 [2.1, 2.3],
+                                 [3.1, 3.3],
+                                 [4.1, 4.3],
+                                 [5.1, 5.3]])
+        roll, pitch, heading, x_translation, y_translation, hscale_factor = PatchTest._return_mean_adjustments(lstsq_result)
+        # each parameter must come from its own row, the horizontal scale factor previously read the y translation row
+        assert roll == 0.2
+        assert pitch == 1.2
+        assert heading == 2.2
+        assert x_translation == 3.2
+        assert y_translation == 4.2
+        assert hscale_factor == 5.2
+
+    def test_return_mean_adjustments_rounding(self):
+        lstsq_result = np.full((6, 2), 0.123456789)
+        adjustments = PatchTest._return_mean_adjustments(lstsq_result)
+        assert adjustments[:5] == (0.1235, 0.1235, 0.1235, 0.1235, 0.1235)  # angles/offsets round to 4 places
+        assert adjustments[5] == 0.12346  # the scale factor keeps 5 places
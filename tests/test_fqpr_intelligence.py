@@ -166,6 +166,109 @@ class TestFqprIntelligence(unittest.TestCase):
         assert self.fintel.svp_intel.unique_id_reverse == {}
         assert self.fintel.svp_intel.type == {}
 
+    def test_intel_duplicate_name_and_size(self):
+        updated_type, new_data, new_project = self.fintel.add_file(self.testsv)
+        assert updated_type == 'svp'
+
+        duplicate_sv = os.path.join(self.tmpfolder, self.svname)
+        shutil.copyfile(self.testsv, duplicate_sv)
+        # same file name and same size in bytes as an existing file is treated as a duplicate and rejected,
+        # even though the file path differs (catches files re-added after being moved)
+        updated_type, new_data, new_project = self.fintel.add_file(duplicate_sv)
+        assert updated_type == ''
+        assert duplicate_sv not in self.fintel.svp_intel.file_name
+        assert self.fintel.svp_intel.file_paths == [self.testsv]
+
+        with open(duplicate_sv, 'a') as ofil:
+            ofil.write('\n')
+        # same file name but a different size is a different file and is accepted
+        updated_type, new_data, new_project = self.fintel.add_file(duplicate_sv)
+        assert updated_type == 'svp'
+        assert self.fintel.svp_intel.file_name[duplicate_sv] == self.svname
+        assert self.fintel.svp_intel.file_paths == [self.testsv, duplicate_sv]
+
+    def _flush_monitor_events_now(self):
+        # cancel the debounce timer and flush the buffered monitor events synchronously, so the test does not
+        # depend on timing
+        with self.fintel._event_lock:
+            if self.fintel._event_flush_timer is not None:
+                self.fintel._event_flush_timer.cancel()
+        self.fintel._flush_monitor_events()
+
+    def test_intel_monitor_event_coalescing(self):
+        self.fintel.monitor_event_buffer_time = 30  # long enough that the timer cannot fire during the test
+        self.fintel._handle_monitor_event(self.testfile, 'created')
+        self.fintel._handle_monitor_event(self.testfile, 'created')  # repeat events for the same file collapse to one
+        self.fintel._handle_monitor_event(self.testsv, 'created')
+        self.fintel._handle_monitor_event(self.testsv, 'deleted')  # created then deleted in the same window cancels out
+        self._flush_monitor_events_now()
+
+        assert self.fintel.multibeam_intel.file_name == {self.testfile: self.filename}
+        assert self.fintel.svp_intel.file_paths == []
+
+        self.fintel._handle_monitor_event(self.testfile, 'deleted')
+        self._flush_monitor_events_now()
+
+        assert self.fintel.multibeam_intel.file_name == {}
+        assert self.fintel.multibeam_intel.line_groups == {}
+
+    def test_intel_max_mbes_size(self):
+        self.fintel.max_mbes_size_kb = 1  # the test line is much larger than 1kb, gets skipped with a warning
+        updated_type, new_data, new_project = self.fintel.add_file(self.testfile)
+        assert updated_type == ''
+        assert new_data is None
+        assert self.fintel.multibeam_intel.file_name == {}
+
+        self.fintel.max_mbes_size_kb = None  # the default, no size gate
+        updated_type, new_data, new_project = self.fintel.add_file(self.testfile)
+        assert updated_type == 'multibeam'
+        assert self.fintel.multibeam_intel.file_name == {self.testfile: self.filename}
+
+    def test_intel_add_folder(self):
+        datafolder = os.path.join(self.tmpfolder, 'monitored')
+        nested = os.path.join(datafolder, 'nested')
+        os.makedirs(nested)
+        newmbes = os.path.join(datafolder, self.filename)
+        newsv = os.path.join(nested, self.svname)
+        shutil.copyfile(self.testfile, newmbes)
+        shutil.copyfile(self.testsv, newsv)
+        with open(os.path.join(datafolder, 'unsupported.txt'), 'w') as ofil:
+            ofil.write('not a kluster file')
+
+        assert self.fintel.add_folder(os.path.join(self.tmpfolder, 'notafolder')) == []
+
+        added = self.fintel.add_folder(datafolder, is_recursive=False)
+        assert added == [newmbes]  # the unsupported file is filtered out, the nested sv requires recursion
+
+        added = self.fintel.add_folder(datafolder, is_recursive=True)
+        assert added == [newsv]  # the multibeam line is already in, only the nested sv is newly added
+        assert self.fintel.multibeam_intel.file_name == {newmbes: self.filename}
+        assert self.fintel.svp_intel.file_paths == [newsv]
+
+    def test_intel_add_files(self):
+        badfile = os.path.join(self.tmpfolder, 'notreal.all')
+        results = self.fintel.add_files([self.testfile, badfile, self.testsv])
+        assert len(results) == 3  # one result per input file, in input order
+
+        updated_type, new_data, new_project = results[0]
+        assert updated_type == 'multibeam'
+        assert new_data['file_path'] == self.testfile
+
+        updated_type, new_data, new_project = results[1]  # one bad path does not abort the batch
+        assert updated_type == ''
+        assert new_data is None
+
+        updated_type, new_data, new_project = results[2]
+        assert updated_type == 'svp'
+        assert new_data['file_path'] == self.testsv
+
+        # module state matches what sequential add_file calls produce
+        assert self.fintel.multibeam_intel.line_groups == {self.expected_data_folder_path: [self.testfile]}
+        assert self.fintel.multibeam_intel.file_name == {self.testfile: self.filename}
+        assert self.fintel.multibeam_intel.matching_fqpr[self.testfile] == ''
+        assert self.fintel.svp_intel.file_paths == [self.testsv]
+        assert self.fintel.svp_intel.file_name == {self.testsv: self.svname}
+
     def test_intel_modes(self):
         self.fintel.add_file(self.testfile)
         # convert multibeam file
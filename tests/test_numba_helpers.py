@@ -1,7 +1,7 @@
 import numpy as np
 import unittest
 
-from HSTB.kluster.numba_helpers import bin2d, bin1d, hist2d_numba_seq
+from HSTB.kluster.numba_helpers import bin2d, bin1d, hist2d_numba_seq, rotate_points_inplace, both_valid_mask
 
 
 class TestNumbaHelper(unittest.TestCase):
@@ -25,3 +25,41 @@ class TestNumbaHelper(unittest.TestCase):
     def test_hist2d_numba_seq(self):
         hist2d = hist2d_numba_seq(self.x, self.y, np.array([2, 2]), np.array([[0, 10], [0, 10]]))
         assert np.array_equal(hist2d, np.array([[5., 0.], [0., 5.]]))
+
+    def test_rotate_points_inplace(self):
+        ang = np.deg2rad(30)
+        cos_az, sin_az = float(np.cos(ang)), float(np.sin(ang))
+        min_x, min_y = 2.0, 3.0
+        x = np.linspace(0, 100, 50)
+        y = np.linspace(-50, 50, 50)
+        # the kernel must match the plain numpy rotation about (min_x, min_y)
+        expected_x = min_x + cos_az * (x - min_x) - sin_az * (y - min_y)
+        expected_y = min_y + sin_az * (x - min_x) + cos_az * (y - min_y)
+        rotate_points_inplace(x, y, min_x, min_y, cos_az, sin_az)
+        assert np.allclose(x, expected_x)
+        assert np.allclose(y, expected_y)
+
+    def test_rotate_points_inplace_nan(self):
+        # fastmath must not break nan propagation, a nan easting or northing has to stay nan through the rotation
+        ang = np.deg2rad(30)
+        cos_az, sin_az = float(np.cos(ang)), float(np.sin(ang))
+        x = np.array([10.0, np.nan, 30.0])
+        y = np.array([1.0, 2.0, np.nan])
+        rotate_points_inplace(x, y, 0.0, 0.0, cos_az, sin_az)
+        assert not np.isnan(x[0]) and not np.isnan(y[0])
+        assert np.isnan(x[1]) and np.isnan(y[1])
+        assert np.isnan(x[2]) and np.isnan(y[2])
+
+    def test_both_valid_mask(self):
+        lyrone = np.array([[1.0, np.nan, 3.0, 4.0],
+                           [np.nan, 5.0, 6.0, np.nan]])
+        lyrtwo = np.array([[1.0, 2.0, np.nan, 4.0],
+                           [np.nan, 5.0, 6.0, 7.0]])
+        # the kernel's self-inequality nan test must match the numpy isnan based mask it replaced
+        expected = np.logical_and(~np.isnan(lyrone), ~np.isnan(lyrtwo))
+        assert np.array_equal(both_valid_mask(lyrone, lyrtwo), expected)
+
+    def test_both_valid_mask_all_valid(self):
+        lyrone = np.ones((3, 3))
+        lyrtwo = np.ones((3, 3))
+        assert both_valid_mask(lyrone, lyrtwo).all()